@@ -0,0 +1,66 @@
+import numpy as np
+from array import array
+
+# Hypixel returns at most 30 price levels per side of each order book
+MAX_LEVELS = 30
+
+# Default number of units to simulate filling against each order book
+DEFAULT_ORDER_SIZE = 1000
+
+# Function to collect order book levels into flat, fixed-width arrays
+def new_book():
+    return {"amounts": array("q"), "prices": array("d"), "rows": 0}
+
+# Function to append one product's summary to a book, padded to MAX_LEVELS
+def add_levels(book, summary):
+    levels = summary[:MAX_LEVELS]
+    for level in levels:
+        book["amounts"].append(int(level["amount"]))
+        book["prices"].append(level["pricePerUnit"])
+    padding = MAX_LEVELS - len(levels)
+    book["amounts"].extend([0] * padding)
+    book["prices"].extend([0.0] * padding)
+    book["rows"] += 1
+
+# Function to turn a collected book into (products x levels) matrices
+def book_matrices(book):
+    shape = (book["rows"], MAX_LEVELS)
+    amounts = np.frombuffer(book["amounts"], dtype=np.int64).reshape(shape)
+    prices = np.frombuffer(book["prices"], dtype=np.float64).reshape(shape)
+    return amounts, prices
+
+# Function to walk every book at once and get the volume-weighted fill price
+def fill_orders(amounts, prices, order_sizes):
+    # Units already taken by better-priced levels before each level
+    before = np.cumsum(amounts, axis=1) - amounts
+    fills = np.clip(order_sizes[:, None] - before, 0, amounts)
+    filled = fills.sum(axis=1)
+    cost = (fills * prices).sum(axis=1)
+    fill_price = np.divide(cost, filled, out=np.zeros_like(cost), where=filled > 0)
+    return fill_price, filled
+
+# Function to compute fill prices and achievable flip profit for an order size
+def compute_depth(buy_book, sell_book, order_size=DEFAULT_ORDER_SIZE):
+    buy_amounts, buy_prices = buy_book
+    sell_amounts, sell_prices = sell_book
+    # Only as many units as both books can absorb are tradable
+    fillable = np.minimum(
+        np.minimum(buy_amounts.sum(axis=1), sell_amounts.sum(axis=1)), order_size
+    )
+    # buy_summary holds the sell offers an instant buy walks through, sell_summary
+    # holds the buy orders an instant sell walks through
+    buy_fill, _ = fill_orders(buy_amounts, buy_prices, fillable)
+    sell_fill, _ = fill_orders(sell_amounts, sell_prices, fillable)
+    # A flip earns the top-of-book spread per unit, and every unit beyond the top
+    # levels gives up the distance walked into each book, so the profit per unit
+    # can only shrink as the order size grows
+    traded = fillable > 0
+    buy_slippage = np.where(traded, buy_fill - buy_prices[:, 0], 0.0)
+    sell_slippage = np.where(traded, sell_prices[:, 0] - sell_fill, 0.0)
+    spread = np.where(traded, buy_prices[:, 0] - sell_prices[:, 0], 0.0)
+    return {
+        "Fill Buy Price": buy_fill,
+        "Fill Sell Price": sell_fill,
+        "Fillable": fillable,
+        "Depth Profit": (spread - buy_slippage - sell_slippage) * fillable,
+    }
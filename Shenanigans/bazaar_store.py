@@ -0,0 +1,189 @@
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+# Where bazaar snapshots are kept on disk
+STORE_DIR = os.environ.get(
+    "BAZAAR_STORE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "bazaar_data")
+)
+RECORDS_PATH = os.path.join(STORE_DIR, "quick_status.bin")
+PRODUCTS_PATH = os.path.join(STORE_DIR, "products.txt")
+CHECKPOINTS_PATH = os.path.join(STORE_DIR, "checkpoints.bin")
+CHECKPOINT_INDEX_PATH = os.path.join(STORE_DIR, "checkpoints.idx")
+
+# Every this many polls the full state is written as a checkpoint, so any point in
+# time is rebuilt from one checkpoint and at most this many polls of records
+CHECKPOINT_EVERY = 60
+
+# One fixed-width record per product whose quick status changed in a poll
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("product", "<i4"),
+    ("buy_price", "<f8"),
+    ("sell_price", "<f8"),
+    ("buy_volume", "<i8"),
+    ("sell_volume", "<i8"),
+])
+VALUE_FIELDS = ["buy_price", "sell_price", "buy_volume", "sell_volume"]
+
+# One index entry per checkpoint: when it was taken, how many records it covers
+# and where its rows (RECORD_DTYPE, one per product) are in the checkpoint file
+CHECKPOINT_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("records", "<i8"),
+    ("start", "<i8"),
+    ("count", "<i8"),
+])
+TABLE_COLUMNS = ["Buy Price", "Sell Price", "Buy Volume", "Sell Volume"]
+
+# Product ID <-> dense index mapping and the latest stored values per product
+_state = {"loaded": False, "products": {}, "names": [], "latest": None, "polls": 0}
+_lock = threading.Lock()
+
+# Function to memory-map a file of fixed-width records without reading it into RAM
+def _map_file(path, dtype):
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+# Function to memory-map every stored record without reading it into RAM
+def read_records():
+    return _map_file(RECORDS_PATH, RECORD_DTYPE)
+
+# Function to memory-map the checkpoint index
+def read_checkpoints():
+    return _map_file(CHECKPOINT_INDEX_PATH, CHECKPOINT_DTYPE)
+
+# Function to get the newest record of every product stored before a timestamp,
+# replaying only the records written after the last checkpoint before it (rows
+# taken from a checkpoint carry the checkpoint's timestamp)
+def state_at(timestamp=None):
+    checkpoints = read_checkpoints()
+    if timestamp is not None:
+        # Records and checkpoints are appended in time order, so cutoffs are binary searches
+        checkpoints = checkpoints[:np.searchsorted(checkpoints["timestamp"], timestamp, side="right")]
+    base = np.zeros(0, dtype=RECORD_DTYPE)
+    records = read_records()
+    if len(checkpoints):
+        checkpoint = checkpoints[-1]
+        start = int(checkpoint["start"])
+        base = _map_file(CHECKPOINTS_PATH, RECORD_DTYPE)[start:start + int(checkpoint["count"])]
+        records = records[int(checkpoint["records"]):]
+    if timestamp is not None:
+        records = records[:np.searchsorted(records["timestamp"], timestamp, side="right")]
+    # Checkpoint rows go first so the records replayed after them take precedence
+    records = np.concatenate([base, records])
+    # The first occurrence in the reversed product column is each product's newest record
+    reversed_products = records["product"][::-1]
+    _, first = np.unique(reversed_products, return_index=True)
+    return np.asarray(records[len(records) - 1 - first])
+
+# Function to load the product mapping and latest values on first use
+def _load_store():
+    if _state["loaded"]:
+        return
+    os.makedirs(STORE_DIR, exist_ok=True)
+    if os.path.exists(PRODUCTS_PATH):
+        with open(PRODUCTS_PATH) as f:
+            _state["names"] = f.read().split()
+    _state["products"] = {name: i for i, name in enumerate(_state["names"])}
+    latest = np.full((len(_state["names"]), len(VALUE_FIELDS)), np.nan)
+    newest = state_at()
+    for i, field in enumerate(VALUE_FIELDS):
+        latest[newest["product"], i] = newest[field]
+    _state["latest"] = latest
+    _state["loaded"] = True
+    # Stores written before checkpoints existed get one, so later reads stay short
+    records = read_records()
+    if len(records) and not len(read_checkpoints()):
+        _write_checkpoint(int(records["timestamp"][-1]))
+
+# Function to write the latest values of every product as a checkpoint
+def _write_checkpoint(timestamp):
+    latest = _state["latest"]
+    products = np.flatnonzero(~np.isnan(latest).all(axis=1))
+    rows = np.zeros(len(products), dtype=RECORD_DTYPE)
+    rows["timestamp"] = timestamp
+    rows["product"] = products
+    for i, field in enumerate(VALUE_FIELDS):
+        rows[field] = latest[products, i]
+    start = len(_map_file(CHECKPOINTS_PATH, RECORD_DTYPE))
+    with open(CHECKPOINTS_PATH, "ab") as f:
+        rows.tofile(f)
+    # The index entry is written last, rows without one are never read
+    entry = np.array([(timestamp, len(read_records()), start, len(rows))], dtype=CHECKPOINT_DTYPE)
+    with open(CHECKPOINT_INDEX_PATH, "ab") as f:
+        entry.tofile(f)
+    _state["polls"] = 0
+
+# Function to map product IDs to dense indexes, registering new products
+def _product_indexes(product_ids):
+    new_names = [name for name in dict.fromkeys(product_ids) if name not in _state["products"]]
+    if new_names:
+        with open(PRODUCTS_PATH, "a") as f:
+            f.write("".join(f"{name}\n" for name in new_names))
+        for name in new_names:
+            _state["products"][name] = len(_state["names"])
+            _state["names"].append(name)
+        grown = np.full((len(new_names), len(VALUE_FIELDS)), np.nan)
+        _state["latest"] = np.vstack([_state["latest"], grown])
+    return np.array([_state["products"][name] for name in product_ids], dtype=np.int32)
+
+# Function to append the products that changed since the last poll
+def append_snapshot(table, timestamp=None):
+    timestamp = int(time.time() * 1000) if timestamp is None else timestamp
+    with _lock:
+        _load_store()
+        indexes = _product_indexes(table["Item ID"].tolist())
+        values = table[TABLE_COLUMNS].to_numpy(dtype=np.float64)
+        # Only rows that differ from the stored values become delta records
+        changed = (values != _state["latest"][indexes]).any(axis=1)
+        records = np.zeros(int(changed.sum()), dtype=RECORD_DTYPE)
+        records["timestamp"] = timestamp
+        records["product"] = indexes[changed]
+        for i, field in enumerate(VALUE_FIELDS):
+            records[field] = values[changed, i]
+        with open(RECORDS_PATH, "ab") as f:
+            records.tofile(f)
+        _state["latest"][indexes[changed]] = values[changed]
+        _state["polls"] += 1
+        if _state["polls"] >= CHECKPOINT_EVERY:
+            _write_checkpoint(timestamp)
+    return len(records)
+
+# Function to get a product's flip profit over time, e.g. for the last 24 hours,
+# as the points where it changed (it holds its value until the next point)
+def profit_history(product_id, since):
+    with _lock:
+        _load_store()
+        index = _state["products"].get(product_id)
+    records = read_records()
+    start = np.searchsorted(records["timestamp"], since)
+    records = records[start:]
+    rows = np.asarray(records[records["product"] == index])
+    return rows["timestamp"], rows["buy_price"] - rows["sell_price"]
+
+# Function to rank products by how much their flip profit moved since a time
+def top_movers(since, top=10):
+    with _lock:
+        _load_store()
+        names = np.array(_state["names"], dtype=object)
+        # The latest values are kept in memory, only the past is read from disk
+        profit_now = _state["latest"][:, 0] - _state["latest"][:, 1]
+    profit_before = np.full(len(names), np.nan)
+    before = state_at(since)
+    # Products registered after the names were copied are left out
+    before = before[before["product"] < len(names)]
+    profit_before[before["product"]] = before["buy_price"] - before["sell_price"]
+    change = profit_now - profit_before
+    # Products without a value at both ends, or that did not move, are skipped
+    moved = np.flatnonzero(np.nan_to_num(change) != 0)
+    order = moved[np.argsort(-np.abs(change[moved]), kind="stable")[:top]]
+    return pd.DataFrame({
+        "Item ID": names[order],
+        "Profit Before": profit_before[order],
+        "Profit Now": profit_now[order],
+        "Change": change[order],
+    })
@@ -1,45 +1,127 @@
 import shiny
 from shiny import App, ui, reactive, render
 import requests
+import ijson
+import itertools
+import numpy as np
 import pandas as pd
+from array import array
 from datetime import datetime, timezone
+from bazaar_depth import (
+    DEFAULT_ORDER_SIZE, add_levels, book_matrices, compute_depth, new_book
+)
+from bazaar_store import append_snapshot, top_movers
 
-# Function to fetch data from Hypixel API
-def get_bazaar_data():
-    url = "https://api.hypixel.net/v2/skyblock/bazaar"
-    response = requests.get(url)
-    data = response.json()
-    return data
+BAZAAR_URL = "https://api.hypixel.net/v2/skyblock/bazaar"
 
-# Function to extract and process quick status from the data
-def extract_quick_status(data):
-    products = data["products"]
-    status_list = []
-    
-    for product_id, details in products.items():
+# Columns shown with two decimals when the table is rendered
+PRICE_COLUMNS = ["Buy Price", "Sell Price", "Flip Profit", "Fill Buy Price", "Fill Sell Price", "Depth Profit"]
+
+# How far back the top movers table looks, in milliseconds
+TOP_MOVERS_WINDOW = 60 * 60 * 1000
+
+# Columns the bazaar table can be ranked by
+SORT_COLUMNS = ["Flip Profit", "Depth Profit"]
+
+# Function to stream products from the Hypixel API one at a time,
+# returning (lastUpdated, products) with products None when nothing changed
+def get_bazaar_data(last_updated=None):
+    response = requests.get(BAZAAR_URL, stream=True, timeout=30)
+    response.raise_for_status()
+    response.raw.decode_content = True  # Let urllib3 undo gzip while streaming
+    # Parse the payload incrementally instead of loading it all with .json()
+    events = ijson.parse(response.raw, use_float=True)
+    for prefix, event, value in events:
+        # lastUpdated precedes the products, so an unchanged bazaar is skipped unparsed
+        if prefix == "lastUpdated":
+            if last_updated is not None and value == last_updated:
+                response.close()
+                return value, None
+            return value, stream_products(response, events)
+        if prefix == "products":
+            # Products came first, put the event back and parse them anyway
+            events = itertools.chain([(prefix, event, value)], events)
+            break
+    return None, stream_products(response, events)
+
+# Function to yield (product ID, details) pairs from the parse events
+def stream_products(response, events):
+    with response:
+        yield from ijson.kvitems(events, "products")
+
+# Function to extract quick status and order books from the data in one pass
+def extract_bazaar(products):
+    item_ids = []
+    buy_prices = array("d")
+    sell_prices = array("d")
+    buy_volumes = array("q")
+    sell_volumes = array("q")
+    buy_book = new_book()
+    sell_book = new_book()
+
+    for product_id, details in products:
         # Skip items starting with "ENCHANTMENT"
         if product_id.startswith("ENCHANTMENT"):
             continue
-        
+
         quick_status = details["quick_status"]
-        buy_price = quick_status['buyPrice']
-        sell_price = quick_status['sellPrice']
-        flip_profit = buy_price - sell_price
-        
-        status_list.append({
-            "Item ID": quick_status["productId"],
-            "Buy Price": f"{buy_price:.2f}",
-            "Sell Price": f"{sell_price:.2f}",
-            "Buy Volume": quick_status["buyVolume"],
-            "Sell Volume": quick_status["sellVolume"],
-            "Flip Profit": f"{flip_profit:.2f}"
-        })
-    
-    # Convert to DataFrame and sort by Flip Profit from most to least
-    df = pd.DataFrame(status_list)
-    df["Flip Profit"] = df["Flip Profit"].astype(float)
-    df = df.sort_values(by="Flip Profit", ascending=False)
-    
+        item_ids.append(quick_status["productId"])
+        buy_prices.append(quick_status["buyPrice"])
+        sell_prices.append(quick_status["sellPrice"])
+        buy_volumes.append(quick_status["buyVolume"])
+        sell_volumes.append(quick_status["sellVolume"])
+        add_levels(buy_book, details.get("buy_summary", []))
+        add_levels(sell_book, details.get("sell_summary", []))
+
+    # Build numeric columns directly and compute flip profit for all rows at once
+    buy_prices = np.frombuffer(buy_prices, dtype=np.float64)
+    sell_prices = np.frombuffer(sell_prices, dtype=np.float64)
+    flip_profit = buy_prices - sell_prices
+
+    # Sort by Flip Profit from most to least, keeping the books in the same order
+    order = np.argsort(-flip_profit, kind="stable")
+    table = pd.DataFrame({
+        "Item ID": np.array(item_ids, dtype=object)[order],
+        "Buy Price": buy_prices[order],
+        "Sell Price": sell_prices[order],
+        "Buy Volume": np.frombuffer(buy_volumes, dtype=np.int64)[order],
+        "Sell Volume": np.frombuffer(sell_volumes, dtype=np.int64)[order],
+        "Flip Profit": flip_profit[order],
+    })
+    buy_amounts, buy_levels = book_matrices(buy_book)
+    sell_amounts, sell_levels = book_matrices(sell_book)
+    return {
+        "table": table,
+        "buy_book": (buy_amounts[order], buy_levels[order]),
+        "sell_book": (sell_amounts[order], sell_levels[order]),
+    }
+
+# Function to fetch the bazaar and record what changed in the snapshot store,
+# returning the previous data as-is when the bazaar has not updated since
+def refresh_bazaar(previous=None):
+    last_updated = previous["last_updated"] if previous else None
+    last_updated, products = get_bazaar_data(last_updated)
+    if products is None:
+        return previous
+    bazaar = extract_bazaar(products)
+    bazaar["last_updated"] = last_updated
+    append_snapshot(bazaar["table"], last_updated)
+    return bazaar
+
+# Function to extract and process quick status from the data
+def extract_quick_status(products):
+    return extract_bazaar(products)["table"]
+
+# Function to add order book depth columns for an order size and rank the table
+def rank_bazaar(bazaar, order_size=DEFAULT_ORDER_SIZE, sort_by="Flip Profit"):
+    table = bazaar["table"].assign(**compute_depth(bazaar["buy_book"], bazaar["sell_book"], order_size))
+    return table.sort_values(by=sort_by, ascending=False, kind="stable")
+
+# Function to format the price columns with two decimals for display
+def format_bazaar_table(df):
+    df = df.copy()
+    for column in PRICE_COLUMNS:
+        df[column] = np.char.mod("%.2f", df[column].to_numpy())
     return df
 
 # Shiny UI
@@ -49,6 +131,11 @@ app_ui = ui.page_fluid(
         ui.input_action_button("refresh", "Refresh Data", class_="btn btn-primary"),
         style="text-align: center; margin-bottom: 20px;"
     ),
+    ui.div(
+        ui.input_numeric("order_size", "Order Size", DEFAULT_ORDER_SIZE, min=1),
+        ui.input_select("sort_by", "Rank By", SORT_COLUMNS),
+        style="display: flex; justify-content: center; gap: 20px;"
+    ),
     ui.div(
         ui.output_ui("bazaar_table"),
         style="max-width: 900px; margin: 0 auto; border: 2px solid #ccc; padding: 20px; border-radius: 8px; background-color: #f9f9f9;"
@@ -57,6 +144,11 @@ app_ui = ui.page_fluid(
         ui.output_text("last_updated", container=ui.h6),
         style="text-align: center; margin-top: 10px;"
     ),
+    ui.div(
+        ui.h3("Top Movers (Last Hour)", style="text-align: center;"),
+        ui.output_ui("movers_table"),
+        style="max-width: 900px; margin: 30px auto 0; border: 2px solid #ccc; padding: 20px; border-radius: 8px; background-color: #f9f9f9;"
+    ),
     style="background-color: #FFFFFF; padding: 20px;"
 )
 
@@ -64,14 +156,15 @@ app_ui = ui.page_fluid(
 def server(input, output, session):
 
     # Reactive value to store item data and last update time
-    data_store = reactive.Value(extract_quick_status(get_bazaar_data()))
+    data_store = reactive.Value(refresh_bazaar())
     last_update_time = reactive.Value(datetime.now(timezone.utc).strftime('%I:%M %p UTC'))
 
     # Fetch data when the refresh button is clicked
     @reactive.Effect
     @reactive.event(input.refresh)
     def on_refresh():
-        data_store.set(extract_quick_status(get_bazaar_data()))
+        # Setting the same object again does not re-render the tables
+        data_store.set(refresh_bazaar(data_store.get()))
         last_update_time.set(datetime.now(timezone.utc).strftime('%I:%M %p UTC'))
 
     # Render the last updated time
@@ -84,10 +177,24 @@ def server(input, output, session):
     @output
     @render.ui
     def bazaar_table():
-        df = data_store.get()
+        order_size = input.order_size() or DEFAULT_ORDER_SIZE
+        df = format_bazaar_table(rank_bazaar(data_store.get(), order_size, input.sort_by()))
         # Render the table as HTML with the proper layout and styles
         return ui.HTML(df.to_html(index=False, escape=False, justify='center', classes='table table-striped table-hover'))
 
+    # Render the products whose flip profit moved the most in the last hour
+    @output
+    @render.ui
+    def movers_table():
+        data_store.get()  # Re-rank after every refresh
+        since = int(datetime.now(timezone.utc).timestamp() * 1000) - TOP_MOVERS_WINDOW
+        df = top_movers(since)
+        for column in ["Profit Before", "Profit Now", "Change"]:
+            df[column] = np.char.mod("%.2f", df[column].to_numpy())
+        return ui.HTML(df.to_html(index=False, escape=False, justify='center', classes='table table-striped table-hover'))
+
 # Run the app
 app = App(app_ui, server)
-shiny.run_app(app)
+
+if __name__ == "__main__":
+    shiny.run_app(app)
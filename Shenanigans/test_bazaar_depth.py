@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from bazaar_depth import add_levels, book_matrices, compute_depth, new_book
+
+# Order sizes walked through from smallest to largest
+ORDER_SIZES = [1, 10, 100, 1000, 3000, 10000, 100000]
+
+# Function to build a book from (amount, price per unit) levels for each product
+def make_book(products):
+    book = new_book()
+    for levels in products:
+        add_levels(book, [{"amount": amount, "pricePerUnit": price} for amount, price in levels])
+    return book_matrices(book)
+
+# Function to build random books shaped like the Hypixel API's, sell offers rising
+# from the buy price and buy orders falling from the sell price
+def random_books(products=200, seed=0):
+    rng = np.random.default_rng(seed)
+    buy_levels, sell_levels = [], []
+    for _ in range(products):
+        buy = rng.uniform(1, 10000)
+        sell = buy * rng.uniform(0.7, 1.0)
+        depth = int(rng.integers(0, 31))
+        # Each level is priced at least as far from the top as the one before
+        buy_prices = buy + np.cumsum(rng.uniform(0, 5, depth))
+        sell_prices = sell - np.cumsum(rng.uniform(0, 5, depth))
+        buy_levels.append([(int(rng.integers(1, 5000)), price) for price in buy_prices])
+        sell_levels.append([(int(rng.integers(1, 5000)), price) for price in sell_prices])
+    return make_book(buy_levels), make_book(sell_levels)
+
+# Test a flip filled across two levels of each book against hand-computed profits
+@pytest.mark.parametrize("order_size, profit", [(10, 100.0), (15, 50.0), (20, 0.0), (50, 0.0)])
+def test_depth_profit_gives_up_slippage(order_size, profit):
+    buy_book = make_book([[(10, 100.0), (10, 110.0)]])
+    sell_book = make_book([[(10, 90.0), (10, 80.0)]])
+    depth = compute_depth(buy_book, sell_book, order_size)
+    assert depth["Fillable"][0] == min(order_size, 20)
+    assert depth["Depth Profit"][0] == pytest.approx(profit)
+
+# Test that a product with an empty book has nothing to fill and no profit
+def test_empty_book_has_no_profit():
+    buy_book = make_book([[], [(10, 100.0)]])
+    sell_book = make_book([[(10, 90.0)], []])
+    depth = compute_depth(buy_book, sell_book, 100)
+    assert depth["Fillable"].tolist() == [0, 0]
+    assert depth["Depth Profit"].tolist() == [0.0, 0.0]
+
+# Test that filling deeper into the books never raises the profit per unit, which
+# would rank thin, wide-spread products first
+def test_profit_per_unit_never_grows_with_order_size():
+    buy_book, sell_book = random_books()
+    previous = None
+    for order_size in ORDER_SIZES:
+        depth = compute_depth(buy_book, sell_book, order_size)
+        fillable = depth["Fillable"]
+        per_unit = np.divide(depth["Depth Profit"], fillable, out=np.zeros(len(fillable)), where=fillable > 0)
+        if previous is not None:
+            assert np.all(per_unit <= previous + 1e-6), f"profit per unit grew at order size {order_size}"
+        previous = per_unit
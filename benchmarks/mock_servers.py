@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Number of daily history entries served per item
+HISTORY_DAYS = 120
+HISTORY_DATES = [
+    time.strftime("%Y-%m-%dT00:00:00.000Z", time.gmtime(1.7e9 + day * 86400))
+    for day in range(HISTORY_DAYS)
+]
+
+
+# Function to build a synthetic GW2 item entry
+def synthetic_item(item_id):
+    return {"id": item_id, "name": f"Item {item_id}", "type": "CraftingMaterial"}
+
+
+# Function to build a synthetic GW2 trading post price entry
+def synthetic_price(item_id):
+    buy = 100 + (item_id * 37) % 50000
+    return {
+        "id": item_id,
+        "whitelisted": False,
+        "buys": {"quantity": 1000 + item_id % 500, "unit_price": buy},
+        "sells": {"quantity": 800 + item_id % 300, "unit_price": buy + buy // 5 + 1},
+    }
+
+
+# Function to build synthetic DataWars2 history for an item
+def synthetic_history(item_id, start=""):
+    entries = []
+    for day, date in enumerate(HISTORY_DATES):
+        if date[:10] < start:
+            continue
+        base = 100 + (item_id * 37 + day * 13) % 50000
+        entries.append(
+            {
+                "itemID": item_id,
+                "date": date,
+                "sell_price_min": base + 10,
+                "sell_price_max": base + 90,
+                "sell_price_avg": base + 50,
+                "buy_price_min": base - 50,
+                "buy_price_max": base,
+                "buy_price_avg": base - 25,
+            }
+        )
+    return entries
+
+
+# Function to build a synthetic Hypixel bazaar payload
+def synthetic_bazaar(products):
+    rng = random.Random(products)
+    payload = {"success": True, "lastUpdated": int(time.time() * 1000), "products": {}}
+    for i in range(products):
+        product_id = f"PRODUCT_{i}"
+        buy = rng.uniform(1, 10000)
+        sell = buy * rng.uniform(0.7, 1.0)
+        payload["products"][product_id] = {
+            "product_id": product_id,
+            "quick_status": {
+                "productId": product_id,
+                "buyPrice": buy,
+                "sellPrice": sell,
+                "buyVolume": rng.randint(0, 10**6),
+                "sellVolume": rng.randint(0, 10**6),
+            },
+            "buy_summary": [
+                {
+                    "amount": rng.randint(1, 5000),
+                    "pricePerUnit": buy + level,
+                    "orders": 1,
+                }
+                for level in range(30)
+            ],
+            "sell_summary": [
+                {
+                    "amount": rng.randint(1, 5000),
+                    "pricePerUnit": sell - level,
+                    "orders": 1,
+                }
+                for level in range(30)
+            ],
+        }
+    return payload
+
+
+# Function to load recorded payloads, falling back to synthetic ones when absent
+def load_payloads(items, recorded_dir=None):
+    recorded = {}
+    for name in ("items", "prices", "history", "bazaar"):
+        path = os.path.join(recorded_dir or "", f"{name}.json")
+        if recorded_dir and os.path.exists(path):
+            with open(path) as f:
+                recorded[name] = json.load(f)
+    prices = {entry["id"]: entry for entry in recorded.get("prices", [])}
+    bazaar = recorded.get("bazaar") or synthetic_bazaar(items)
+    return {
+        "ids": list(prices) or list(range(1, items + 1)),
+        "items": {entry["id"]: entry for entry in recorded.get("items", [])},
+        "prices": prices,
+        "history": recorded.get("history"),
+        "bazaar": json.dumps(bazaar).encode(),
+    }
+
+
+# Function to create the request handler for one mock server configuration
+def make_handler(payloads, latency, error_rate):
+    known = set(payloads["ids"])
+
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def handle(self):
+            try:
+                super().handle()
+            except ConnectionError:
+                # Clients may hang up mid-response, as bztracker does when the
+                # bazaar's lastUpdated has not changed
+                pass
+
+        def send_json(self, status, body):
+            data = body if isinstance(body, bytes) else json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            if error_rate and random.random() < error_rate:
+                return self.send_json(503, {"text": "injected error"})
+
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/v2/build":
+                return self.send_json(200, {"id": 1})
+            if url.path == "/v2/skyblock/bazaar":
+                return self.send_json(200, payloads["bazaar"])
+            if url.path == "/gw2/v1/history":
+                item_id = int(query["itemID"][0])
+                if payloads["history"] is not None:
+                    return self.send_json(200, payloads["history"])
+                start = query.get("start", [""])[0]
+                return self.send_json(200, synthetic_history(item_id, start))
+            if url.path in ("/v2/items", "/v2/commerce/prices"):
+                if "ids" not in query:
+                    return self.send_json(200, payloads["ids"])
+                ids = [int(i) for i in query["ids"][0].split(",")]
+                found = [i for i in ids if i in known]
+                if url.path == "/v2/items":
+                    recorded, build = payloads["items"], synthetic_item
+                else:
+                    recorded, build = payloads["prices"], synthetic_price
+                body = [recorded.get(i) or build(i) for i in found]
+                # Mirror the GW2 API: 206 for partial results, 404 for none
+                status = 200 if len(found) == len(ids) else 206 if found else 404
+                return self.send_json(status, body)
+            self.send_json(404, {"text": "not found"})
+
+    return MockHandler
+
+
+# Function to start the mock GW2, DataWars2 and Hypixel server in the background
+def start_mock_server(items=5, latency=0.0, error_rate=0.0, recorded_dir=None, port=0):
+    payloads = load_payloads(items, recorded_dir)
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", port), make_handler(payloads, latency, error_rate)
+    )
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# Function to run a mock server until the process is stopped, reporting its port
+def serve_forever(items, latency, error_rate, recorded_dir, port_queue):
+    server = start_mock_server(items, latency, error_rate, recorded_dir)
+    port_queue.put(server.server_port)
+    threading.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve mock upstream APIs")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--items", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--recorded", help="directory of recorded JSON payloads")
+    args = parser.parse_args()
+    server = start_mock_server(
+        args.items, args.latency, args.error_rate, args.recorded, args.port
+    )
+    print(f"Mock APIs listening on http://127.0.0.1:{server.server_port}")
+    threading.Event().wait()
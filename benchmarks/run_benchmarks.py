@@ -0,0 +1,165 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Keep every cache and store of the benchmarked code in a throwaway directory
+WORK_DIR = tempfile.mkdtemp(prefix="gw2-bench-")
+os.environ["GW2_CACHE_DIR"] = os.path.join(WORK_DIR, "cache")
+os.environ["BAZAAR_STORE_DIR"] = os.path.join(WORK_DIR, "bazaar")
+sys.path[:0] = [os.path.join(ROOT, "edition4"), os.path.join(ROOT, "Shenanigans")]
+
+import requests
+import bazaar_store
+import bztracker
+import gw2api
+import history_store
+import http_client
+import item_cache
+import pipeline
+from mock_servers import serve_forever
+
+DEFAULT_SIZES = [5, 500, 27000]
+
+
+# Function to start a mock server in its own process so it does not share our GIL
+def start_mock_process(items, latency, error_rate, recorded_dir):
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    process = context.Process(
+        target=serve_forever,
+        args=(items, latency, error_rate, recorded_dir, port_queue),
+        daemon=True,
+    )
+    process.start()
+    return process, port_queue.get(timeout=60)
+
+
+# Function to point the GW2, DataWars2 and Hypixel clients at a mock server
+def use_mock_server(port):
+    base = f"http://127.0.0.1:{port}"
+    gw2api.ITEMS_ENDPOINT = f"{base}/v2/items"
+    gw2api.PRICES_ENDPOINT = f"{base}/v2/commerce/prices"
+    gw2api.BUILD_ENDPOINT = f"{base}/v2/build"
+    history_store.HISTORY_ENDPOINT = f"{base}/gw2/v1/history?itemID="
+    bztracker.BAZAAR_URL = f"{base}/v2/skyblock/bazaar"
+    # Measure our pipeline, not the production rate limits
+    host = f"127.0.0.1:{port}"
+    http_client.HOST_RATE_LIMITS[host] = (10**9, 10**9)
+    http_client.HOST_CONCURRENCY[host] = http_client.MAX_WORKERS
+
+
+# Function to forget every cache so the next call runs cold
+def reset_caches():
+    for path in (item_cache.ITEM_CACHE_PATH, history_store.HISTORY_STORE_PATH):
+        if os.path.exists(path):
+            os.remove(path)
+    http_client._conditional.clear()
+    history_store._synced_at.clear()
+    gw2api._last_good_prices.clear()
+    gw2api._build.update(id=None, checked_at=0.0)
+    pipeline._previous.update(ids=None, baselines=None, row_hashes=None, data=None)
+
+
+# Function to empty the bazaar snapshot store so the next poll records everything
+def reset_bazaar_store():
+    shutil.rmtree(bazaar_store.STORE_DIR, ignore_errors=True)
+    bazaar_store._state.update(
+        loaded=False, products={}, names=[], latest=None, polls=0
+    )
+
+
+# Function to time one cold call and a number of warm calls, in milliseconds
+def measure(function, repeat, reset=None):
+    if reset is not None:
+        reset()
+    start = time.perf_counter()
+    function()
+    cold = (time.perf_counter() - start) * 1000
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        warm.append((time.perf_counter() - start) * 1000)
+    return cold, statistics.median(warm), min(warm)
+
+
+# Function to benchmark the GW2 pipeline for a number of tracked items
+def bench_items(size, repeat):
+    item_ids = list(range(1, size + 1))
+    pipeline.ITEM_IDS = item_ids
+
+    def averages():
+        executor = history_store.get_history_executor()
+        list(executor.map(pipeline.fetch_30_entry_average, item_ids))
+
+    return [
+        (
+            "get_sorted_items_data",
+            measure(pipeline.get_sorted_items_data, repeat, reset_caches),
+        ),
+        ("fetch_30_entry_average", measure(averages, repeat, reset_caches)),
+    ]
+
+
+# Function to poll the bazaar until a poll succeeds, bztracker does not retry
+# so an injected error costs a whole extra poll, as on its next timer tick
+def poll_bazaar(previous=None):
+    while True:
+        try:
+            return bztracker.refresh_bazaar(previous)
+        except requests.RequestException:
+            continue
+
+
+# Function to benchmark polling the bazaar for a number of products, from the
+# request through streaming, extraction and the snapshot store
+def bench_bazaar(size, repeat):
+    previous = poll_bazaar()
+    return [
+        ("refresh_bazaar", measure(poll_bazaar, repeat, reset_bazaar_store)),
+        # lastUpdated has not moved, so the products are never parsed
+        ("refresh_bazaar unchanged", measure(lambda: poll_bazaar(previous), repeat)),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the refresh hot paths offline"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma separated item counts",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="warm runs per benchmark")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="mock latency in seconds"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="mock 503 rate")
+    parser.add_argument("--recorded", help="directory of recorded JSON payloads")
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<26}{'items':>8}{'cold ms':>12}{'warm ms':>12}{'best ms':>12}")
+    try:
+        for size in [int(size) for size in args.sizes.split(",")]:
+            process, port = start_mock_process(
+                size, args.latency, args.error_rate, args.recorded
+            )
+            try:
+                use_mock_server(port)
+                results = bench_items(size, args.repeat) + bench_bazaar(
+                    size, args.repeat
+                )
+            finally:
+                process.terminate()
+            for name, (cold, warm, best) in results:
+                print(f"{name:<26}{size:>8}{cold:>12.1f}{warm:>12.1f}{best:>12.1f}")
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
@@ -166,4 +166,5 @@ def server(input, output, session):
 
 # Run the app
 app = App(app_ui, server)
-shiny.run_app(app)
+if __name__ == "__main__":
+    shiny.run_app(app)
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from broadcast import diff_frames
+from item_cache import CACHE_DIR
+from metrics import inc
+from pipeline import BASELINE_COLUMN
+
+ALERT_STORE_PATH = os.path.join(CACHE_DIR, "alerts.sqlite3")
+
+# Triggered alerts are appended here as JSON Lines
+ALERT_LOG_PATH = os.environ.get(
+    "GW2_ALERT_LOG", os.path.join(CACHE_DIR, "alerts.jsonl")
+)
+
+# A rule that fired is quiet for this many seconds, so a price hovering around
+# the threshold does not notify on every refresh
+ALERT_DEBOUNCE = int(os.environ.get("GW2_ALERT_DEBOUNCE", "900"))
+
+# Values a rule can watch: the buy price in copper, or the profit against the
+# profit baseline in percent
+ALERT_METRICS = ("buy_price", "profit_pct")
+ALERT_DIRECTIONS = ("below", "above")
+
+_lock = threading.Lock()
+
+
+# Function to open the alert store, creating the table on first use
+def open_alert_store():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(ALERT_STORE_PATH, timeout=30)
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rules (
+            id INTEGER PRIMARY KEY,
+            item_id INTEGER NOT NULL,
+            metric TEXT NOT NULL,
+            direction TEXT NOT NULL,
+            threshold REAL NOT NULL,
+            notified_at REAL
+        )
+        """
+    )
+    # Rules are sorted by threshold within each item, so the rules a price move
+    # crosses are one index range
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS rules_by_threshold
+        ON rules (item_id, metric, direction, threshold)
+        """
+    )
+    return connection
+
+
+# Function to add an alert rule, returning its ID
+def add_alert(item_id, metric, direction, threshold):
+    if metric not in ALERT_METRICS:
+        raise ValueError(f"Unknown alert metric: {metric}")
+    if direction not in ALERT_DIRECTIONS:
+        raise ValueError(f"Unknown alert direction: {direction}")
+    with _lock, closing(open_alert_store()) as connection, connection:
+        cursor = connection.execute(
+            "INSERT INTO rules (item_id, metric, direction, threshold) "
+            "VALUES (?, ?, ?, ?)",
+            (item_id, metric, direction, threshold),
+        )
+        return cursor.lastrowid
+
+
+# Function to remove an alert rule, returning whether it existed
+def remove_alert(rule_id):
+    with _lock, closing(open_alert_store()) as connection, connection:
+        cursor = connection.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
+        return cursor.rowcount > 0
+
+
+# Function to list the alert rules, optionally for one item
+def list_alerts(item_id=None):
+    query = "SELECT id, item_id, metric, direction, threshold, notified_at FROM rules"
+    params = ()
+    if item_id is not None:
+        query += " WHERE item_id = ?"
+        params = (item_id,)
+    with _lock, closing(open_alert_store()) as connection:
+        rows = connection.execute(query + " ORDER BY id", params).fetchall()
+    columns = ["id", "item_id", "metric", "direction", "threshold", "notified_at"]
+    return [dict(zip(columns, row)) for row in rows]
+
+
+# Function to compute the watched values of some items, as
+# {item_id: {metric: value}}, profit is left out for items without a baseline
+def alert_values(df, item_ids):
+    rows = df[df["ID"].isin(item_ids)].set_index("ID")
+    baseline = rows[BASELINE_COLUMN].astype("float64")
+    columns = {
+        "buy_price": rows["Price"].astype("float64"),
+        "profit_pct": (rows["Profit"] / baseline * 100).where(baseline > 0),
+    }
+    values = {}
+    for metric, column in columns.items():
+        for item_id, value in column.dropna().items():
+            values.setdefault(item_id, {})[metric] = float(value)
+    return values
+
+
+# Function to find the rules a move from previous to value crossed, skipping
+# rules that already fired within the debounce window
+def crossed_rules(connection, item_id, metric, previous, value, quiet_since):
+    if value < previous:
+        # Falling values cross "below" rules with value < threshold <= previous
+        direction, bounds = "below", "threshold > ? AND threshold <= ?"
+        low, high = value, previous
+    else:
+        # Rising values cross "above" rules with previous <= threshold < value
+        direction, bounds = "above", "threshold >= ? AND threshold < ?"
+        low, high = previous, value
+    return connection.execute(
+        f"SELECT id, threshold FROM rules "
+        f"WHERE item_id = ? AND metric = ? AND direction = ? AND {bounds} "
+        f"AND (notified_at IS NULL OR notified_at <= ?)",
+        (item_id, metric, direction, low, high, quiet_since),
+    ).fetchall()
+
+
+# Function to check the rules of the items that changed between two snapshots
+# and write a notification for every rule whose threshold was crossed
+def evaluate_alerts(old, new):
+    changed = list(diff_frames(old, new))
+    if not changed:
+        return []
+    before = alert_values(old, changed)
+    after = alert_values(new, changed)
+    names = new[new["ID"].isin(changed)].set_index("ID")["Name"]
+    now = time.time()
+    notifications = []
+    with _lock, closing(open_alert_store()) as connection, connection:
+        for item_id in changed:
+            for metric, value in after.get(item_id, {}).items():
+                previous = before.get(item_id, {}).get(metric)
+                if previous is None or previous == value:
+                    continue
+                for rule_id, threshold in crossed_rules(
+                    connection, item_id, metric, previous, value, now - ALERT_DEBOUNCE
+                ):
+                    notifications.append(
+                        {
+                            "rule_id": rule_id,
+                            "item_id": item_id,
+                            "name": names[item_id],
+                            "metric": metric,
+                            "direction": "below" if value < previous else "above",
+                            "threshold": threshold,
+                            "previous": previous,
+                            "value": value,
+                            "at": now,
+                        }
+                    )
+        connection.executemany(
+            "UPDATE rules SET notified_at = ? WHERE id = ?",
+            [(now, notification["rule_id"]) for notification in notifications],
+        )
+    if notifications:
+        with open(ALERT_LOG_PATH, "a", encoding="utf-8") as sink:
+            for notification in notifications:
+                sink.write(json.dumps(notification) + "\n")
+        inc("gw2_alerts_total", len(notifications))
+    return notifications
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage price alert rules")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="add a rule")
+    add.add_argument("item_id", type=int)
+    add.add_argument("metric", choices=ALERT_METRICS)
+    add.add_argument("direction", choices=ALERT_DIRECTIONS)
+    add.add_argument(
+        "threshold", type=float, help="copper for buy_price, percent for profit_pct"
+    )
+    listing = commands.add_parser("list", help="list rules")
+    listing.add_argument("--item-id", type=int)
+    remove = commands.add_parser("remove", help="remove a rule")
+    remove.add_argument("rule_id", type=int)
+    args = parser.parse_args()
+
+    if args.command == "add":
+        rule_id = add_alert(args.item_id, args.metric, args.direction, args.threshold)
+        print(f"Added rule {rule_id}")
+    elif args.command == "list":
+        for rule in list_alerts(args.item_id):
+            print(
+                f"{rule['id']:>6}  {rule['item_id']:>8}  {rule['metric']:<11}"
+                f"{rule['direction']:<6}{rule['threshold']:>12g}"
+            )
+    elif not remove_alert(args.rule_id):
+        parser.exit(1, f"alerts: no rule {args.rule_id}\n")
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from history_store import HISTORY_COLUMNS, history_connection
+
+# Default windows, counted in history entries (DataWars2 stores one per day)
+DEFAULT_WINDOWS = (7, 30, 90)
+
+# Statistics computed for the sell price of every window
+SELL_STATISTICS = ("mean", "median", "std", "min", "max")
+
+
+# Function to load the newest history rows of many items in a single query
+def load_history_frame(item_ids, max_entries=None):
+    item_ids = list(dict.fromkeys(item_ids))
+    if not item_ids:
+        return pd.DataFrame(columns=["item_id", "date", *HISTORY_COLUMNS, "age"])
+    placeholders = ",".join("?" * len(item_ids))
+    query = (
+        f"SELECT item_id, date, {', '.join(HISTORY_COLUMNS)}, "
+        f"ROW_NUMBER() OVER (PARTITION BY item_id ORDER BY date DESC) - 1 AS age "
+        f"FROM history WHERE item_id IN ({placeholders})"
+    )
+    params = list(item_ids)
+    if max_entries is not None:
+        query = f"SELECT * FROM ({query}) WHERE age < ?"
+        params.append(max_entries)
+    with history_connection() as connection:
+        frame = pd.read_sql_query(query, connection, params=params)
+    # Parse every timestamp in one vectorized call
+    frame["date"] = pd.to_datetime(frame["date"], utc=True)
+    frame[HISTORY_COLUMNS] = frame[HISTORY_COLUMNS].astype("float64")
+    return frame
+
+
+# Function to compute rolling statistics for all items in one vectorized pass
+def compute_history_stats(item_ids, windows=DEFAULT_WINDOWS, unit="entries"):
+    if unit not in ("entries", "days"):
+        raise ValueError(f"Unknown window unit: {unit}")
+    max_entries = max(windows) if unit == "entries" else None
+    frame = load_history_frame(item_ids, max_entries)
+    frame["spread"] = frame["sell_price_min"] - frame["buy_price_max"]
+
+    if unit == "days":
+        # Age in days relative to each item's newest entry
+        newest = frame.groupby("item_id")["date"].transform("max")
+        frame["age"] = (newest - frame["date"]).dt.days
+
+    stats = []
+    for window in windows:
+        in_window = frame[frame["age"] < window]
+        grouped = in_window.groupby("item_id")
+        sell = grouped["sell_price_min"].agg(list(SELL_STATISTICS))
+        sell.columns = [f"sell_{stat}_{window}" for stat in SELL_STATISTICS]
+        sell[f"spread_mean_{window}"] = grouped["spread"].mean()
+        stats.append(sell)
+
+    stats = pd.concat(stats, axis=1) if stats else pd.DataFrame()
+    # Items without history get zeros, matching the old 30-entry average
+    stats = stats.reindex(list(dict.fromkeys(item_ids))).astype("float64")
+    return np.rint(stats.fillna(0)).astype("int64")
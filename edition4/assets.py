@@ -0,0 +1,82 @@
+import json
+import mimetypes
+import os
+from starlette.datastructures import Headers
+from starlette.staticfiles import StaticFiles
+
+# Front-end bundles built by build_assets.py, served under /dist
+DIST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dist")
+MANIFEST_NAME = "manifest.json"
+
+# Bundle names contain a hash of their content, so browsers may keep them forever
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Pre-compressed variants written next to each bundle, best encoding first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+# Function to load the map of bundle names to their hashed file names,
+# None when the bundles have not been built
+def load_asset_manifest():
+    try:
+        with open(os.path.join(DIST_DIR, MANIFEST_NAME)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+# Function to parse an Accept-Encoding header into each encoding's quality,
+# e.g. "gzip;q=0.5, br" -> {"gzip": 0.5, "br": 1.0}
+def encoding_qualities(header):
+    qualities = {}
+    for part in header.split(","):
+        encoding, *params = [value.strip() for value in part.split(";")]
+        if not encoding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[encoding.lower()] = quality
+    return qualities
+
+
+# Function to order the pre-compressed encodings the browser accepts, highest
+# quality first, leaving out those refused with q=0
+def accepted_encodings(header):
+    qualities = encoding_qualities(header)
+    accepted = []
+    for encoding, suffix in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > 0:
+            accepted.append((quality, encoding, suffix))
+    # Sorting is stable, so equal qualities keep the best encoding first
+    accepted.sort(key=lambda entry: -entry[0])
+    return [(encoding, suffix) for _, encoding, suffix in accepted]
+
+
+# Static files that prefer a pre-compressed variant the browser accepts and mark
+# hashed bundles as immutable
+class AssetFiles(StaticFiles):
+    async def get_response(self, path, scope):
+        header = Headers(scope=scope).get("accept-encoding", "")
+        response = None
+        for encoding, suffix in accepted_encodings(header):
+            full_path, stat_result = self.lookup_path(path + suffix)
+            if stat_result is not None:
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Content-Type"] = (
+                    mimetypes.guess_type(path)[0] or "application/octet-stream"
+                )
+                break
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        if os.path.basename(path) != MANIFEST_NAME:
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        return response
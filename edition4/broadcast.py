@@ -0,0 +1,91 @@
+import asyncio
+import itertools
+import os
+import threading
+import time
+
+# Minimum seconds between two pushes to the same session, changes arriving in
+# between (or while a slow client is still receiving) are merged into one push
+PUSH_INTERVAL = float(os.environ.get("GW2_PUSH_INTERVAL", "1"))
+
+_subscribers = {}
+_lock = threading.Lock()
+_keys = itertools.count()
+
+
+# Function to find the cells that changed between two tables, as
+# {row key: set of changed columns}; rows only in one table are left out
+def diff_frames(old, new, key="ID"):
+    if old is None or new is None:
+        return {}
+    old = old.set_index(key)
+    new = new.set_index(key)
+    common = new.index.intersection(old.index)
+    columns = new.columns.intersection(old.columns)
+    changed = old.loc[common, columns].ne(new.loc[common, columns])
+    changes = {}
+    for column in columns:
+        for row_key in changed.index[changed[column].to_numpy()]:
+            changes.setdefault(row_key, set()).add(column)
+    return changes
+
+
+# Function to hand the changes between two snapshots to every subscriber,
+# the diff is computed once however many sessions are connected
+def publish_changes(old, new):
+    changes = diff_frames(old, new)
+    if not changes:
+        return
+    with _lock:
+        for subscriber in _subscribers.values():
+            for row_key, columns in changes.items():
+                subscriber["pending"].setdefault(row_key, set()).update(columns)
+            if not subscriber["scheduled"]:
+                subscriber["scheduled"] = True
+                subscriber["loop"].call_soon_threadsafe(_start_flush, subscriber)
+
+
+# Function to start flushing a subscriber on its own event loop
+def _start_flush(subscriber):
+    subscriber["task"] = subscriber["loop"].create_task(_flush(subscriber))
+
+
+# Function to send a subscriber's pending changes, at most once per interval
+async def _flush(subscriber):
+    while True:
+        delay = subscriber["sent_at"] + PUSH_INTERVAL - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        with _lock:
+            changes, subscriber["pending"] = subscriber["pending"], {}
+        try:
+            await subscriber["send"](changes)
+        except Exception as e:
+            print(f"Error pushing price changes: {e}")
+        subscriber["sent_at"] = time.monotonic()
+        with _lock:
+            if not subscriber["pending"] or subscriber["key"] not in _subscribers:
+                subscriber["scheduled"] = False
+                return
+
+
+# Function to receive pushed changes on the running event loop, returning a
+# function that unsubscribes again
+def subscribe(send):
+    key = next(_keys)
+    with _lock:
+        _subscribers[key] = {
+            "key": key,
+            "send": send,
+            "loop": asyncio.get_running_loop(),
+            "pending": {},
+            "scheduled": False,
+            "sent_at": 0.0,
+            "task": None,
+        }
+
+    def unsubscribe():
+        with _lock:
+            _subscribers.pop(key, None)
+
+    return unsubscribe
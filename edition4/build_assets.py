@@ -0,0 +1,108 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import htmltools
+from assets import DIST_DIR, MANIFEST_NAME
+
+try:
+    import brotli
+except ImportError:  # Brotli variants are optional, gzip is always written
+    brotli = None
+
+try:
+    from esbuild_py import transform
+except ImportError:  # Only needed to build, the built bundles are checked in
+    transform = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+# React production builds shipped with htmltools, which Shiny depends on, put in
+# front of the menu so the bundle needs nothing from a CDN
+REACT_DIR = os.path.join(os.path.dirname(os.path.abspath(htmltools.__file__)), "lib")
+REACT_SCRIPTS = (
+    os.path.join(REACT_DIR, "react", "react.production.min.js"),
+    os.path.join(REACT_DIR, "react-dom", "react-dom.production.min.js"),
+)
+
+# Bundle name: source file, relative to the static directory
+ENTRY_POINTS = {
+    "planet_menu.js": os.path.join("js", "react_component.js"),
+    "styles.css": os.path.join("css", "styles.css"),
+}
+
+# Length of the content hash put into each bundle's file name
+HASH_LENGTH = 12
+
+
+# Function to read a file as text
+def read_text(path):
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+# Function to compile the menu's JSX with esbuild and bundle it after React
+def bundle_script(source):
+    compiled = transform(read_text(source))
+    if not compiled:
+        raise RuntimeError(f"esbuild could not compile {source}")
+    parts = [read_text(path) for path in REACT_SCRIPTS]
+    # The menu's own top-level names stay out of the page's global scope
+    parts.append(f"(function () {{\n{compiled}}})();\n")
+    return "\n".join(parts).encode("utf-8")
+
+
+# Function to bundle a stylesheet, which is served as written
+def bundle_stylesheet(source):
+    with open(source, "rb") as file:
+        return file.read()
+
+
+# Bundler for each kind of entry point
+BUNDLERS = {".js": bundle_script, ".css": bundle_stylesheet}
+
+
+# Function to add a content hash to a file name, e.g. planet_menu.1a2b3c.js
+def hashed_name(name, content):
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()[:HASH_LENGTH]
+    stem, extension = os.path.splitext(name)
+    return f"{stem}.{digest}{extension}"
+
+
+# Function to write a bundle and its pre-compressed variants
+def write_bundle(name, content):
+    path = os.path.join(DIST_DIR, name)
+    with open(path, "wb") as file:
+        file.write(content)
+    # mtime=0 keeps the gzip output identical between builds
+    with open(f"{path}.gz", "wb") as file:
+        file.write(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(f"{path}.br", "wb") as file:
+            file.write(brotli.compress(content, quality=11))
+
+
+# Function to build every entry point into the dist directory with a manifest
+def build_assets():
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    os.makedirs(DIST_DIR)
+    manifest = {}
+    for name, source in ENTRY_POINTS.items():
+        bundler = BUNDLERS[os.path.splitext(name)[1]]
+        content = bundler(os.path.join(STATIC_DIR, source))
+        manifest[name] = hashed_name(name, content)
+        write_bundle(manifest[name], content)
+    with open(os.path.join(DIST_DIR, MANIFEST_NAME), "w") as file:
+        json.dump(manifest, file, indent=2)
+        file.write("\n")
+    return manifest
+
+
+if __name__ == "__main__":
+    if transform is None:
+        sys.exit("build_assets: run `pip install esbuild-py brotli` first")
+    for name, hashed in build_assets().items():
+        size = os.path.getsize(os.path.join(DIST_DIR, hashed))
+        print(f"{name:<16}{hashed:<36}{size:>10} bytes")
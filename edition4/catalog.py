@@ -0,0 +1,314 @@
+import argparse
+import bisect
+import json
+import os
+import shutil
+import threading
+import time
+import numpy as np
+from gw2api import (
+    BUILD_CHECK_INTERVAL,
+    ITEMS_ENDPOINT,
+    chunk_ids,
+    fetch_chunk,
+    fetch_current_build,
+)
+from http_client import get, get_executor
+from item_cache import CACHE_DIR, replace_file
+from shared_store import acquire_leadership
+
+# Searchable catalog of every item name, one directory of index files per build
+CATALOG_DIR = os.path.join(CACHE_DIR, "catalog")
+CATALOG_META_PATH = os.path.join(CATALOG_DIR, "catalog.json")
+
+# Index files, all saved as .npy and memory-mapped when the catalog is loaded.
+# Items are stored in the order of their lower-case names, so names sharing a
+# prefix are next to each other
+CATALOG_FILES = (
+    "ids",  # int32 item IDs, by name
+    "names",  # UTF-8 names as shown, concatenated
+    "name_offsets",  # int64 start of each name, plus the end
+    "keys",  # UTF-8 lower-case names, concatenated
+    "key_offsets",  # int64 start of each key, plus the end
+    "trigrams",  # uint32 sorted distinct three-byte sequences of the keys
+    "trigram_offsets",  # int64 start of each trigram's postings, plus the end
+    "postings",  # int32 positions of the items containing each trigram
+    "sorted_ids",  # int32 item IDs, by ID
+    "id_positions",  # int32 position of each of sorted_ids
+)
+
+# Results returned per search by default
+CATALOG_SEARCH_LIMIT = 20
+
+# Seconds between checks for a new game build, no more often than the build
+# itself is fetched
+CATALOG_CHECK_INTERVAL = BUILD_CHECK_INTERVAL
+
+# Seconds before the first retry of a failed build, doubling with each further
+# failure up to the check interval; other processes also check this often
+# whether the building process is gone
+CATALOG_RETRY_DELAY = 30
+
+# The loaded catalog, mapped again only when a new one has been built
+_catalog = {"dir": None, "mtime": None, "arrays": None}
+_lock = threading.Lock()
+_builder = {"thread": None}
+
+
+# Function to get the key an item name is searched and sorted by
+def search_key(name):
+    return " ".join(name.casefold().split()).encode("utf-8")
+
+
+# Function to encode every three-byte sequence of a key as an integer
+def key_trigrams(key):
+    return {
+        (key[i] << 16) | (key[i + 1] << 8) | key[i + 2] for i in range(len(key) - 2)
+    }
+
+
+# Function to fetch one chunk of items, reduced to (ID, name) pairs
+def fetch_item_names(chunk):
+    return [
+        (entry["id"], entry["name"])
+        for entry in fetch_chunk(ITEMS_ENDPOINT, chunk)
+        if entry.get("name", "").strip()
+    ]
+
+
+# Function to concatenate byte strings into one array and their offsets
+def pack_strings(values):
+    offsets = np.zeros(len(values) + 1, dtype="int64")
+    offsets[1:] = np.cumsum([len(value) for value in values])
+    return np.frombuffer(b"".join(values), dtype="uint8"), offsets
+
+
+# Function to build every index array from (ID, name) pairs
+def build_index(items):
+    items = sorted((search_key(name), item_id, name) for item_id, name in items)
+    keys = [key for key, _, _ in items]
+    ids = np.array([item_id for _, item_id, _ in items], dtype="int32")
+    arrays = {"ids": ids}
+    arrays["names"], arrays["name_offsets"] = pack_strings(
+        [name.encode("utf-8") for _, _, name in items]
+    )
+    arrays["keys"], arrays["key_offsets"] = pack_strings(keys)
+
+    # Inverted index: for each trigram, the positions of the keys containing it
+    codes, positions = [], []
+    for position, key in enumerate(keys):
+        trigrams = key_trigrams(key)
+        codes.extend(trigrams)
+        positions.extend([position] * len(trigrams))
+    codes = np.array(codes, dtype="uint32")
+    positions = np.array(positions, dtype="int32")
+    order = np.lexsort((positions, codes))
+    arrays["trigrams"], counts = np.unique(codes[order], return_counts=True)
+    arrays["trigram_offsets"] = np.zeros(len(counts) + 1, dtype="int64")
+    arrays["trigram_offsets"][1:] = np.cumsum(counts)
+    arrays["postings"] = positions[order]
+
+    id_order = np.argsort(ids, kind="stable")
+    arrays["sorted_ids"] = ids[id_order]
+    arrays["id_positions"] = id_order.astype("int32")
+    return arrays
+
+
+# Function to download every item name and write a new catalog
+def build_catalog(build=None):
+    response = get(ITEMS_ENDPOINT)
+    response.raise_for_status()
+    executor = get_executor(ITEMS_ENDPOINT)
+    futures = [
+        executor.submit(fetch_item_names, chunk) for chunk in chunk_ids(response.json())
+    ]
+    items = [item for future in futures for item in future.result()]
+    arrays = build_index(items)
+
+    # Each build goes to a new directory and the metadata is switched over
+    # last, so processes still mapping the old files are not disturbed
+    name = f"build-{build}-{int(time.time())}"
+    directory = os.path.join(CATALOG_DIR, name)
+    os.makedirs(directory)
+    for file_name, values in arrays.items():
+        np.save(os.path.join(directory, f"{file_name}.npy"), values)
+    meta = {"dir": name, "build": build, "count": len(items), "built_at": time.time()}
+    replace_file(CATALOG_META_PATH, lambda file: json.dump(meta, file))
+    for entry in os.listdir(CATALOG_DIR):
+        if entry != name and os.path.isdir(os.path.join(CATALOG_DIR, entry)):
+            shutil.rmtree(os.path.join(CATALOG_DIR, entry), ignore_errors=True)
+    return meta
+
+
+# Function to read the catalog metadata, None before the first build
+def read_catalog_meta():
+    try:
+        with open(CATALOG_META_PATH) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+# Function to map the index files of the latest catalog, None before the first
+# build; nothing is read from disk until a search touches the pages it needs
+def load_catalog():
+    try:
+        mtime = os.stat(CATALOG_META_PATH).st_mtime_ns
+    except OSError:
+        return None
+    with _lock:
+        if mtime != _catalog["mtime"]:
+            meta = read_catalog_meta()
+            if meta is None:
+                return _catalog["arrays"]
+            if meta["dir"] != _catalog["dir"]:
+                directory = os.path.join(CATALOG_DIR, meta["dir"])
+                _catalog["arrays"] = {
+                    file_name: np.load(
+                        os.path.join(directory, f"{file_name}.npy"), mmap_mode="r"
+                    )
+                    for file_name in CATALOG_FILES
+                }
+                _catalog["dir"] = meta["dir"]
+            _catalog["mtime"] = mtime
+        return _catalog["arrays"]
+
+
+# Sequence view of the packed keys, so bisect can search them without copying
+class PackedStrings:
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position):
+        start, end = self.offsets[position], self.offsets[position + 1]
+        return self.values[start:end].tobytes()
+
+
+# Function to find the positions of the keys starting with a prefix
+def prefix_positions(keys, prefix, limit):
+    start = bisect.bisect_left(keys, prefix)
+    positions = []
+    for position in range(start, min(start + limit, len(keys))):
+        if not keys[position].startswith(prefix):
+            break
+        positions.append(position)
+    return positions
+
+
+# Function to find the positions of the keys containing a query anywhere, by
+# intersecting the postings of its trigrams and checking the candidates left
+def substring_positions(arrays, keys, query, limit, skip=()):
+    postings = []
+    for code in key_trigrams(query):
+        index = np.searchsorted(arrays["trigrams"], code)
+        if index == len(arrays["trigrams"]) or arrays["trigrams"][index] != code:
+            return []
+        start, end = arrays["trigram_offsets"][index : index + 2]
+        postings.append(arrays["postings"][start:end])
+    postings.sort(key=len)
+    candidates = postings[0]
+    for other in postings[1:]:
+        if not len(candidates):
+            return []
+        candidates = np.intersect1d(candidates, other, assume_unique=True)
+    positions = []
+    for position in candidates.tolist():
+        if position not in skip and query in keys[position]:
+            positions.append(position)
+            if len(positions) == limit:
+                break
+    return positions
+
+
+# Function to search item names, names starting with the query first and then
+# names containing it, each in alphabetical order, as (item ID, name) pairs
+def search_items(query, limit=CATALOG_SEARCH_LIMIT):
+    arrays = load_catalog()
+    query = search_key(query)
+    if arrays is None or not query:
+        return []
+    keys = PackedStrings(arrays["keys"], arrays["key_offsets"])
+    positions = prefix_positions(keys, query, limit)
+    if len(positions) < limit and len(query) >= 3:
+        positions += substring_positions(
+            arrays, keys, query, limit - len(positions), set(positions)
+        )
+    names = PackedStrings(arrays["names"], arrays["name_offsets"])
+    return [(int(arrays["ids"][p]), names[p].decode("utf-8")) for p in positions]
+
+
+# Function to look up the names of some items, leaving out unknown IDs
+def item_names(item_ids):
+    arrays = load_catalog()
+    if arrays is None:
+        return {}
+    sorted_ids = arrays["sorted_ids"]
+    names = PackedStrings(arrays["names"], arrays["name_offsets"])
+    found = {}
+    for item_id in item_ids:
+        index = np.searchsorted(sorted_ids, item_id)
+        if index < len(sorted_ids) and sorted_ids[index] == item_id:
+            position = arrays["id_positions"][index]
+            found[item_id] = names[position].decode("utf-8")
+    return found
+
+
+# Function to build the catalog when there is none yet or the game build changed
+def update_catalog():
+    build = fetch_current_build()
+    meta = read_catalog_meta()
+    if meta is None or (build is not None and meta.get("build") != build):
+        build_catalog(build)
+
+
+# Function run by the background thread, keeping the catalog at the current
+# build in whichever process holds the lead
+def _catalog_loop(interval):
+    failures = 0
+    while True:
+        if not acquire_leadership("catalog"):
+            time.sleep(CATALOG_RETRY_DELAY)
+            continue
+        try:
+            update_catalog()
+            failures = 0
+            time.sleep(interval)
+        except Exception as e:
+            print(f"Error building item catalog: {e}")
+            time.sleep(min(interval, CATALOG_RETRY_DELAY * 2**failures))
+            failures += 1
+
+
+# Function to start keeping the catalog up to date in the background, once per
+# process
+def start_catalog_builder(interval=CATALOG_CHECK_INTERVAL):
+    with _lock:
+        if _builder["thread"] is not None:
+            return
+        _builder["thread"] = threading.Thread(
+            target=_catalog_loop, args=(interval,), name="catalog-builder", daemon=True
+        )
+        _builder["thread"].start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or search the item catalog")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("build", help="download every item name and index them")
+    search = commands.add_parser("search", help="search item names")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=CATALOG_SEARCH_LIMIT)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        meta = build_catalog(fetch_current_build())
+        print(f"Indexed {meta['count']} items into {meta['dir']}")
+    else:
+        if load_catalog() is None:
+            parser.exit(1, "catalog: no catalog yet, run `python3 catalog.py build`\n")
+        for item_id, name in search_items(args.query, args.limit):
+            print(f"{item_id:>8}  {name}")
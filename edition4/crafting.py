@@ -0,0 +1,292 @@
+import heapq
+import json
+import math
+import os
+import threading
+import time
+import pandas as pd
+from gw2api import chunk_ids, fetch_chunk, fetch_current_build
+from http_client import get, get_executor
+from item_cache import CACHE_DIR, replace_file
+from market_scan import get_market
+from shared_store import acquire_leadership
+
+# API Endpoints
+RECIPES_ENDPOINT = "https://api.guildwars2.com/v2/recipes"
+
+# Recipes may ask for coins, which cost their amount in copper
+COIN_CURRENCY_ID = 1
+
+# Recipes of each game build are downloaded by one worker process and cached
+# on disk, where the other workers pick them up
+RECIPES_CACHE_DIR = os.path.join(CACHE_DIR, "recipes")
+RECIPES_LEADER_NAME = "recipes"
+
+# Recipe fields the engine uses, the rest of each payload is not cached
+RECIPE_FIELDS = (
+    "id",
+    "output_item_id",
+    "output_item_count",
+    "ingredients",
+    "guild_ingredients",
+)
+
+# Seconds between checks for a new market scan or game build
+CRAFTING_POLL_INTERVAL = 5
+
+# Recipe graph: recipes by output item, the outputs each item is an ingredient
+# of, and each item's height in the graph (items nobody crafts are 0)
+_graph = {"build": None, "recipes": None, "users": {}, "depth": {}}
+
+# Cheapest trading post listing of every item, in copper
+_prices = {}
+
+# Memoized cheapest way to get one unit of every craftable item, as
+# (cost, recipe ID or None when buying is cheaper)
+_costs = {}
+
+_lock = threading.Lock()
+_engine = {"thread": None, "scanned_at": None, "version": 0}
+
+
+# Function to fetch one chunk of recipes, keeping only the fields in use
+def fetch_recipe_chunk(chunk):
+    return [
+        {field: recipe[field] for field in RECIPE_FIELDS if field in recipe}
+        for recipe in fetch_chunk(RECIPES_ENDPOINT, chunk)
+    ]
+
+
+# Function to download every recipe from the GW2 API
+def fetch_recipes():
+    response = get(RECIPES_ENDPOINT)
+    response.raise_for_status()
+    executor = get_executor(RECIPES_ENDPOINT)
+    futures = [
+        executor.submit(fetch_recipe_chunk, chunk)
+        for chunk in chunk_ids(response.json())
+    ]
+    return [recipe for future in futures for recipe in future.result()]
+
+
+# Function to build the path of a game build's cached recipes
+def recipes_path(build):
+    return os.path.join(RECIPES_CACHE_DIR, f"recipes-{build}.json")
+
+
+# Function to get the recipes of a game build from the disk cache, downloading
+# them when this process is the elected one; None while another process is
+def load_recipe_list(build):
+    try:
+        with open(recipes_path(build)) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        pass
+    if not acquire_leadership(RECIPES_LEADER_NAME):
+        return None
+    recipes = fetch_recipes()
+    replace_file(recipes_path(build), lambda file: json.dump(recipes, file))
+    # Recipes of older builds are never read again
+    for entry in os.listdir(RECIPES_CACHE_DIR):
+        if entry.endswith(".json") and entry != os.path.basename(recipes_path(build)):
+            os.remove(os.path.join(RECIPES_CACHE_DIR, entry))
+    return recipes
+
+
+# Function to read a recipe's item ingredients and coin cost, None when it
+# needs something that cannot be bought (other currencies, guild upgrades)
+def recipe_inputs(recipe):
+    items, coins = [], 0
+    for ingredient in recipe.get("ingredients", []):
+        kind = ingredient.get("type", "Item")
+        # Older recipe payloads name the ingredient "item_id"
+        ingredient_id = ingredient.get("id", ingredient.get("item_id"))
+        if kind == "Item":
+            items.append((ingredient_id, ingredient["count"]))
+        elif kind == "Currency" and ingredient_id == COIN_CURRENCY_ID:
+            coins += ingredient["count"]
+        else:
+            return None
+    if recipe.get("guild_ingredients"):
+        return None
+    return items, coins
+
+
+# Function to build the recipe graph and the height of every item in it
+def build_graph(recipes):
+    by_output, users = {}, {}
+    for recipe in recipes:
+        inputs = recipe_inputs(recipe)
+        if inputs is None:
+            continue
+        items, coins = inputs
+        output = recipe["output_item_id"]
+        by_output.setdefault(output, []).append(
+            (recipe["id"], recipe.get("output_item_count", 1) or 1, items, coins)
+        )
+        for ingredient_id, _ in items:
+            users.setdefault(ingredient_id, set()).add(output)
+
+    # Depth-first walk without recursion, ingredients get their height first
+    depth, visiting = {}, set()
+    for root in by_output:
+        stack = [(root, False)]
+        while stack:
+            item_id, expanded = stack.pop()
+            if item_id in depth:
+                continue
+            ingredients = {
+                ingredient_id
+                for _, _, items, _ in by_output.get(item_id, [])
+                for ingredient_id, _ in items
+            }
+            if expanded:
+                # An ingredient still being visited means a cycle, count it as 0
+                visiting.discard(item_id)
+                depth[item_id] = 1 + max(
+                    (depth.get(i, 0) for i in ingredients), default=-1
+                )
+            elif item_id not in visiting:
+                visiting.add(item_id)
+                stack.append((item_id, True))
+                stack.extend(
+                    (i, False)
+                    for i in ingredients
+                    if i not in depth and i not in visiting
+                )
+    return by_output, users, depth
+
+
+# Function to get the cheapest known cost of one unit of an item
+def item_cost(item_id):
+    if item_id in _costs:
+        return _costs[item_id][0]
+    return _prices.get(item_id, math.inf)
+
+
+# Function to find the cheapest way to get one unit of a craftable item
+def evaluate_item(item_id):
+    best = (_prices.get(item_id, math.inf), None)
+    for recipe_id, output_count, items, coins in _graph["recipes"].get(item_id, []):
+        total = coins + sum(count * item_cost(i) for i, count in items)
+        if total / output_count < best[0]:
+            best = (total / output_count, recipe_id)
+    return best
+
+
+# Function to re-evaluate items and, only when their cost changed, everything
+# crafted from them; ingredients always come off the heap before their outputs
+def propagate(item_ids):
+    depth, users = _graph["depth"], _graph["users"]
+    heap = [(depth.get(item_id, 0), item_id) for item_id in item_ids]
+    heapq.heapify(heap)
+    queued = set(item_ids)
+    evaluated = 0
+    while heap:
+        _, item_id = heapq.heappop(heap)
+        cost = evaluate_item(item_id)
+        evaluated += 1
+        if _costs.get(item_id) == cost:
+            continue
+        _costs[item_id] = cost
+        for user in users.get(item_id, ()):
+            if user not in queued:
+                queued.add(user)
+                heapq.heappush(heap, (depth[user], user))
+    return evaluated
+
+
+# Function to load the recipes of a game build and cost every craftable item,
+# returning False while another process is still downloading them
+def load_recipes(build=None):
+    recipes = load_recipe_list(build)
+    if recipes is None:
+        return False
+    by_output, users, depth = build_graph(recipes)
+    with _lock:
+        _graph.update(build=build, recipes=by_output, users=users, depth=depth)
+        _costs.clear()
+        propagate(list(by_output))
+        _engine["version"] += 1
+    return True
+
+
+# Function to apply new trading post prices, re-evaluating only the items
+# whose price changed and the items crafted from them
+def update_prices(prices):
+    with _lock:
+        changed = {i for i, price in prices.items() if _prices.get(i) != price}
+        changed |= _prices.keys() - prices.keys()
+        _prices.clear()
+        _prices.update(prices)
+        if _graph["recipes"] is None or not changed:
+            return 0
+        recipes, users = _graph["recipes"], _graph["users"]
+        start = {i for i in changed if i in recipes}
+        for item_id in changed:
+            start |= users.get(item_id, set())
+        evaluated = propagate(start)
+        _engine["version"] += 1
+        return evaluated
+
+
+# Function to take the cheapest listing of every item from a market scan
+def update_market(table):
+    listed = table[table["sell_price"] > 0]
+    return update_prices(
+        dict(zip(listed["id"].tolist(), listed["sell_price"].tolist()))
+    )
+
+
+# Function to get the craftable items, or the ones worth crafting
+def crafting_table(top=50, cheaper_only=True):
+    with _lock:
+        rows = [
+            (item_id, _prices.get(item_id, 0), math.ceil(cost), recipe_id)
+            for item_id, (cost, recipe_id) in _costs.items()
+            if recipe_id is not None and math.isfinite(cost)
+        ]
+    table = pd.DataFrame(rows, columns=["id", "buy_price", "craft_cost", "recipe_id"])
+    table = table.astype("int64")
+    table["saving"] = table["buy_price"] - table["craft_cost"]
+    if cheaper_only:
+        # Items that are not listed have nothing to compare against
+        table = table[table["buy_price"] > 0]
+    return table.nlargest(top, "saving")
+
+
+# Function run by the background thread, keeping the costs in step with the
+# recipes of the current build and the latest market scan
+def _crafting_loop(interval):
+    while True:
+        try:
+            build = fetch_current_build()
+            # Until another process has cached the recipes, only prices are kept
+            if _graph["recipes"] is None or build != _graph["build"]:
+                load_recipes(build)
+            market = get_market()
+            if (
+                market["table"] is not None
+                and market["scanned_at"] != _engine["scanned_at"]
+            ):
+                update_market(market["table"])
+                _engine["scanned_at"] = market["scanned_at"]
+        except Exception as e:
+            print(f"Error updating crafting costs: {e}")
+        time.sleep(interval)
+
+
+# Function to start the crafting engine once per process
+def start_crafting_engine(interval=CRAFTING_POLL_INTERVAL):
+    with _lock:
+        if _engine["thread"] is not None:
+            return
+        _engine["thread"] = threading.Thread(
+            target=_crafting_loop, args=(interval,), name="crafting", daemon=True
+        )
+        _engine["thread"].start()
+
+
+# Function to get a version number that changes whenever the costs do
+def get_crafting_version():
+    return _engine["version"]
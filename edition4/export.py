@@ -0,0 +1,108 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from history_store import HISTORY_COLUMNS
+from pipeline import (
+    ITEM_COLUMNS,
+    export_history_rows,
+    export_item_rows,
+    load_tracked_items,
+)
+
+# Output formats, picked from the file extension when --format is not given
+# (standard output defaults to CSV)
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+
+EXPORT_COLUMNS = {
+    "prices": list(ITEM_COLUMNS),
+    "history": ["item_id", "date", *HISTORY_COLUMNS],
+}
+
+
+# Function to open the output file, "-" writes to standard output
+def open_output(path):
+    if path == "-":
+        return os.fdopen(os.dup(sys.stdout.fileno()), "w", newline="")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+# Function to write rows as CSV with a header line
+def write_csv(rows, columns, path):
+    with open_output(path) as output:
+        writer = csv.DictWriter(output, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# Function to write rows as JSON Lines, one object per line
+def write_jsonl(rows, columns, path):
+    with open_output(path) as output:
+        for row in rows:
+            output.write(json.dumps({c: row[c] for c in columns}) + "\n")
+
+
+# Function to write rows as Parquet, the only format that needs pandas
+def write_parquet(rows, columns, path):
+    if path == "-":
+        raise ValueError("Parquet output needs a file path")
+    import pandas as pd
+
+    pd.DataFrame(rows, columns=columns).to_parquet(path, index=False)
+
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "parquet": write_parquet}
+
+
+# Function to work out the output format from the arguments
+def output_format(path, format=None):
+    if format is not None:
+        return format
+    if path == "-":
+        return "csv"
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Cannot tell the format of {path}, use --format")
+    return FORMATS[extension]
+
+
+# Function to export a price or history snapshot for the given item IDs
+def export(kind, path, item_ids=None, format=None, limit=None):
+    format = output_format(path, format)
+    if kind == "prices":
+        rows = export_item_rows(item_ids)
+    else:
+        rows = export_history_rows(item_ids, limit)
+    WRITERS[format](rows, EXPORT_COLUMNS[kind], path)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Export GW2 price or history snapshots without the dashboard"
+    )
+    parser.add_argument("kind", choices=list(EXPORT_COLUMNS), help="what to export")
+    parser.add_argument("output", help="output file, or - for standard output")
+    parser.add_argument("--format", choices=list(WRITERS), help="output format")
+    parser.add_argument(
+        "--ids",
+        default=",".join(str(item_id) for item_id in load_tracked_items()),
+        help="comma separated item IDs (default: the tracked items)",
+    )
+    parser.add_argument(
+        "--limit", type=int, help="most recent history entries per item"
+    )
+    args = parser.parse_args()
+
+    try:
+        count = export(
+            args.kind,
+            args.output,
+            [int(item_id) for item_id in args.ids.split(",")],
+            args.format,
+            args.limit,
+        )
+    except (ValueError, ImportError) as e:
+        parser.exit(1, f"export: {e}\n")
+    print(f"Exported {count} {args.kind} rows", file=sys.stderr)
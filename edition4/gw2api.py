@@ -0,0 +1,98 @@
+import time
+import requests
+from http_client import get, get_executor, get_json_conditional
+from item_cache import load_cached_items, store_items
+
+# API Endpoints
+ITEMS_ENDPOINT = "https://api.guildwars2.com/v2/items"
+PRICES_ENDPOINT = "https://api.guildwars2.com/v2/commerce/prices"
+BUILD_ENDPOINT = "https://api.guildwars2.com/v2/build"
+
+# The GW2 API accepts at most 200 IDs per ?ids= request
+BULK_CHUNK_SIZE = 200
+
+# How often to ask the API whether a new game build has been released
+BUILD_CHECK_INTERVAL = 60 * 60
+
+_build = {"id": None, "checked_at": 0.0}
+
+# Last price successfully fetched for each item, used when a fetch fails
+_last_good_prices = {}
+
+
+# Function to split a list of IDs into chunks the bulk endpoints accept
+def chunk_ids(ids, size=BULK_CHUNK_SIZE):
+    ids = list(dict.fromkeys(ids))  # De-duplicate while keeping order
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
+
+# Function to fetch one chunk of IDs from a GW2 bulk endpoint
+def fetch_chunk(endpoint, chunk, conditional=False):
+    params = {"ids": ",".join(str(i) for i in chunk)}
+    try:
+        if conditional:
+            # Unchanged chunks come back as the previously parsed entries
+            return get_json_conditional(endpoint, params)[0]
+        response = get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
+    except requests.HTTPError as e:
+        # 206 means some of the IDs were unknown, 404 means all of them were
+        if e.response is not None and e.response.status_code == 404:
+            return []
+        print(f"Error fetching {endpoint} for {len(chunk)} IDs: {e}")
+        return []
+    except Exception as e:
+        print(f"Error fetching {endpoint} for {len(chunk)} IDs: {e}")
+        return []
+
+
+# Function to fetch IDs from several bulk endpoints in parallel, keyed by endpoint
+def fetch_bulk(ids_by_endpoint):
+    futures = [
+        (endpoint, get_executor(endpoint).submit(fetch_chunk, endpoint, chunk, True))
+        for endpoint, ids in ids_by_endpoint.items()
+        for chunk in chunk_ids(ids)
+    ]
+    results = {endpoint: {} for endpoint in ids_by_endpoint}
+    for endpoint, future in futures:
+        for entry in future.result():
+            results[endpoint][entry["id"]] = entry
+    return results
+
+
+# Function to get the current game build ID, checked at most once per interval
+def fetch_current_build():
+    if time.time() - _build["checked_at"] >= BUILD_CHECK_INTERVAL:
+        try:
+            response = get(BUILD_ENDPOINT)
+            response.raise_for_status()
+            _build["id"] = response.json()["id"]
+            _build["checked_at"] = time.time()
+        except Exception as e:
+            # Keep trusting the last known build until the API answers again
+            print(f"Error fetching current game build: {e}")
+    return _build["id"]
+
+
+# Function to fetch item details and prices for all IDs and join them by ID
+def fetch_items_and_prices(ids):
+    # Item details come from the local cache, only unknown items are downloaded
+    build = fetch_current_build()
+    items = load_cached_items(ids, build)
+    missing = [item_id for item_id in ids if item_id not in items]
+    results = fetch_bulk({ITEMS_ENDPOINT: missing, PRICES_ENDPOINT: ids})
+    store_items(results[ITEMS_ENDPOINT], build)
+    items.update(results[ITEMS_ENDPOINT])
+    prices = results[PRICES_ENDPOINT]
+    _last_good_prices.update(prices)
+    # A failed chunk shows slightly stale prices instead of dropping the rows
+    stale = [i for i in ids if i not in prices and i in _last_good_prices]
+    if stale:
+        print(f"Using last known prices for {len(stale)} items")
+        prices.update((item_id, _last_good_prices[item_id]) for item_id in stale)
+    # Missing IDs get an empty entry so each row can fall back on its own
+    return {
+        item_id: (items.get(item_id, {}), prices.get(item_id, {}))
+        for item_id in dict.fromkeys(ids)
+    }
@@ -0,0 +1,157 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from http_client import get, get_executor
+from item_cache import CACHE_DIR
+
+# API Endpoints
+HISTORY_ENDPOINT = "https://api.datawars2.ie/gw2/v1/history?itemID="
+
+HISTORY_STORE_PATH = os.path.join(CACHE_DIR, "history.sqlite3")
+
+# Price columns kept from each DataWars2 history entry
+HISTORY_COLUMNS = [
+    "sell_price_min",
+    "sell_price_max",
+    "sell_price_avg",
+    "buy_price_min",
+    "buy_price_max",
+    "buy_price_avg",
+]
+
+# History is daily, so an item is synced at most once per interval however often
+# prices are refreshed
+HISTORY_SYNC_INTERVAL = int(os.environ.get("GW2_HISTORY_SYNC_INTERVAL", "3600"))
+
+_lock = threading.Lock()
+
+# When each item's history was last synced
+_synced_at = {}
+
+
+# Function to open the history store, creating the table on first use
+def open_history_store():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(HISTORY_STORE_PATH, timeout=30)
+    columns = ", ".join(f"{column} INTEGER" for column in HISTORY_COLUMNS)
+    # Entries are clustered by item and date, so recent rows are an index range
+    connection.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS history (
+            item_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            {columns},
+            PRIMARY KEY (item_id, date)
+        ) WITHOUT ROWID
+        """
+    )
+    return connection
+
+
+# Context manager for reading the history store with the write lock held
+@contextmanager
+def history_connection():
+    with _lock, closing(open_history_store()) as connection:
+        yield connection
+
+
+# Function to get the worker pool history syncs run on, the DataWars2 host's own
+# so its rate limit never delays requests to the GW2 API
+def get_history_executor():
+    return get_executor(HISTORY_ENDPOINT)
+
+
+# Function to get the newest stored entry for an item
+def latest_history_entry(item_id):
+    with _lock, closing(open_history_store()) as connection:
+        row = connection.execute(
+            f"SELECT date, {', '.join(HISTORY_COLUMNS)} FROM history "
+            f"WHERE item_id = ? ORDER BY date DESC LIMIT 1",
+            (item_id,),
+        ).fetchone()
+    if row is None:
+        return None
+    return {"date": row[0], **dict(zip(HISTORY_COLUMNS, row[1:]))}
+
+
+# Function to append history entries, replacing any entry for the same date
+def store_history(item_id, entries):
+    if not entries:
+        return
+    placeholders = ", ".join("?" * (len(HISTORY_COLUMNS) + 2))
+    with _lock, closing(open_history_store()) as connection, connection:
+        connection.executemany(
+            f"INSERT OR REPLACE INTO history "
+            f"(item_id, date, {', '.join(HISTORY_COLUMNS)}) VALUES ({placeholders})",
+            [
+                (item_id, entry["date"], *(entry.get(c) for c in HISTORY_COLUMNS))
+                for entry in entries
+            ],
+        )
+
+
+# Function to download only the history entries newer than what is stored,
+# returning how many entries were new or changed
+def sync_item_history(item_id):
+    if time.time() - _synced_at.get(item_id, 0) < HISTORY_SYNC_INTERVAL:
+        return 0
+    latest = latest_history_entry(item_id)
+    params = None
+    if latest is not None:
+        # Re-fetch the newest stored day as well, it may still be filling in
+        params = {"start": latest["date"][:10]}
+    response = get(f"{HISTORY_ENDPOINT}{item_id}", params=params)
+    response.raise_for_status()
+    entries = response.json()
+    if latest is not None:
+        # ISO 8601 dates compare correctly as strings, so no parsing is needed
+        entries = [
+            entry
+            for entry in entries
+            if entry["date"] > latest["date"]
+            or (
+                entry["date"] == latest["date"]
+                and any(entry.get(c) != latest[c] for c in HISTORY_COLUMNS)
+            )
+        ]
+    store_history(item_id, entries)
+    _synced_at[item_id] = time.time()
+    return len(entries)
+
+
+# Function to load one column of an item's most recent history entries
+def load_recent_history(item_id, limit, column="sell_price_min"):
+    if column not in HISTORY_COLUMNS:
+        raise ValueError(f"Unknown history column: {column}")
+    with _lock, closing(open_history_store()) as connection:
+        rows = connection.execute(
+            f"SELECT {column} FROM history WHERE item_id = ? AND {column} IS NOT NULL "
+            f"ORDER BY date DESC LIMIT ?",
+            (item_id, limit),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+# Function to load the stored history of many items, newest entries first
+def load_history_rows(item_ids, limit=None):
+    item_ids = list(dict.fromkeys(item_ids))
+    if not item_ids:
+        return []
+    placeholders = ",".join("?" * len(item_ids))
+    query = (
+        f"SELECT item_id, date, {', '.join(HISTORY_COLUMNS)}, "
+        f"ROW_NUMBER() OVER (PARTITION BY item_id ORDER BY date DESC) AS age "
+        f"FROM history WHERE item_id IN ({placeholders})"
+    )
+    params = list(item_ids)
+    if limit is not None:
+        query = f"SELECT * FROM ({query}) WHERE age <= ?"
+        params.append(limit)
+    with _lock, closing(open_history_store()) as connection:
+        rows = connection.execute(
+            f"{query} ORDER BY item_id, date DESC", params
+        ).fetchall()
+    columns = ["item_id", "date", *HISTORY_COLUMNS]
+    return [dict(zip(columns, row[:-1])) for row in rows]
@@ -0,0 +1,214 @@
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from metrics import inc, observe
+
+REQUEST_TIMEOUT = 10
+
+# Maximum number of in-flight requests per upstream host
+HOST_CONCURRENCY = {
+    "api.guildwars2.com": 8,
+    "api.datawars2.ie": 4,
+}
+DEFAULT_HOST_CONCURRENCY = 4
+
+# Token bucket per upstream host as (requests per second, burst size),
+# GW2 allows about 600 requests per minute
+HOST_RATE_LIMITS = {
+    "api.guildwars2.com": (10, 60),
+    "api.datawars2.ie": (5, 20),
+}
+DEFAULT_HOST_RATE_LIMIT = (5, 20)
+
+# Retries for rate limited and failing upstream responses
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30
+
+# Size of each worker pool used to run requests in parallel
+MAX_WORKERS = 16
+
+# Validators and parsed bodies of earlier responses, for conditional requests.
+# Every change to the tracked items creates new ?ids= chunks, so only the most
+# recently used responses are kept
+CONDITIONAL_CACHE_SIZE = 256
+_conditional = OrderedDict()
+
+_sessions = {}
+_limits = {}
+_buckets = {}
+_inflight = {}
+_executors = {}
+_lock = threading.Lock()
+
+
+# Function to get the keep-alive session and concurrency limit for a host
+def get_host_session(host):
+    with _lock:
+        if host not in _sessions:
+            limit = HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+            session = requests.Session()
+            # One connection pool per host, sized to its concurrency limit
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=limit)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+            _limits[host] = threading.BoundedSemaphore(limit)
+            rate, burst = HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RATE_LIMIT)
+            _buckets[host] = {
+                "rate": rate,
+                "burst": burst,
+                "tokens": burst,
+                "updated": time.monotonic(),
+            }
+        return _sessions[host], _limits[host]
+
+
+# Function to wait until the host's token bucket allows another request
+def take_token(host):
+    while True:
+        with _lock:
+            bucket = _buckets[host]
+            now = time.monotonic()
+            bucket["tokens"] = min(
+                bucket["burst"],
+                bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"],
+            )
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return
+            wait = (1 - bucket["tokens"]) / bucket["rate"]
+        time.sleep(wait)
+
+
+# Function to get the delay before a retry, honouring Retry-After when sent
+def backoff_delay(attempt, response=None):
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(BACKOFF_CAP, int(retry_after))
+    # Full jitter keeps retrying clients from synchronizing
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+
+# Function to GET a URL with rate limiting and retries on 429/5xx and network errors
+def get_with_retries(url, params=None, headers=None):
+    host = urlsplit(url).netloc
+    endpoint = host + urlsplit(url).path
+    session, limit = get_host_session(host)
+    for attempt in range(MAX_RETRIES + 1):
+        take_token(host)
+        response = None
+        start = time.perf_counter()
+        try:
+            with limit:
+                response = session.get(
+                    url, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+                )
+            observe(
+                "gw2_upstream_request_seconds",
+                time.perf_counter() - start,
+                endpoint=endpoint,
+                status=response.status_code,
+            )
+            observe(
+                "gw2_upstream_payload_bytes", len(response.content), endpoint=endpoint
+            )
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+        except requests.RequestException:
+            observe(
+                "gw2_upstream_request_seconds",
+                time.perf_counter() - start,
+                endpoint=endpoint,
+                status="error",
+            )
+            if attempt == MAX_RETRIES:
+                raise
+        time.sleep(backoff_delay(attempt, response))
+
+
+# Function to GET a URL through its host's pooled session, concurrent identical
+# requests share a single in-flight call
+def get(url, params=None, headers=None):
+    key = (
+        url,
+        tuple(sorted((params or {}).items())),
+        tuple(sorted((headers or {}).items())),
+    )
+    with _lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        future.set_result(get_with_retries(url, params=params, headers=headers))
+    except Exception as e:
+        future.set_exception(e)
+    finally:
+        with _lock:
+            del _inflight[key]
+    return future.result()
+
+
+# Function to GET JSON, reusing the previous result when the upstream has not changed
+def get_json_conditional(url, params=None):
+    key = (url, tuple(sorted((params or {}).items())))
+    with _lock:
+        cached = _conditional.get(key)
+        if cached is not None:
+            _conditional.move_to_end(key)
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        inc("gw2_cache_requests_total", cache="conditional", result="hit")
+        return cached["data"], False
+    response.raise_for_status()
+
+    # Identical bodies are detected by hash, so they are never parsed twice
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached is not None and cached["digest"] == digest:
+        inc("gw2_cache_requests_total", cache="conditional", result="hit")
+        return cached["data"], False
+    inc("gw2_cache_requests_total", cache="conditional", result="miss")
+    data = response.json()
+    with _lock:
+        _conditional[key] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "digest": digest,
+            "data": data,
+        }
+        _conditional.move_to_end(key)
+        while len(_conditional) > CONDITIONAL_CACHE_SIZE:
+            _conditional.popitem(last=False)
+    return data, True
+
+
+# Function to get the worker pool for parallel requests to a URL's host. Each
+# host has its own pool, so tasks waiting on one host's rate limit never hold
+# up requests to another
+def get_executor(url):
+    host = urlsplit(url).netloc
+    with _lock:
+        if host not in _executors:
+            _executors[host] = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix=f"upstream-{host}"
+            )
+        return _executors[host]
@@ -0,0 +1,88 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from metrics import inc
+
+# Where the item metadata cache lives on disk
+CACHE_DIR = os.environ.get(
+    "GW2_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+)
+ITEM_CACHE_PATH = os.path.join(CACHE_DIR, "items.sqlite3")
+
+# Item details rarely change, so cached entries are kept for a week
+ITEM_CACHE_TTL = 7 * 24 * 60 * 60
+
+_lock = threading.Lock()
+
+
+# Function to write a file atomically, readers see the old or the new file
+def replace_file(path, write, mode="w"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, mode) as file:
+        write(file)
+    os.replace(temporary, path)
+
+
+# Function to open the item cache, creating the table on first use
+def open_item_cache():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    connection = sqlite3.connect(ITEM_CACHE_PATH, timeout=30)
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            build INTEGER,
+            fetched_at REAL NOT NULL,
+            payload TEXT NOT NULL
+        )
+        """
+    )
+    return connection
+
+
+# Function to load cached items that are within the TTL and match the game build
+def load_cached_items(ids, build=None):
+    ids = list(ids)
+    if not ids:
+        return {}
+    cutoff = time.time() - ITEM_CACHE_TTL
+    cached = {}
+    with _lock, closing(open_item_cache()) as connection:
+        # Query in batches to stay below SQLite's bound parameter limit
+        for start in range(0, len(ids), 500):
+            batch = ids[start : start + 500]
+            rows = connection.execute(
+                f"SELECT id, build, payload FROM items "
+                f"WHERE fetched_at >= ? AND id IN ({','.join('?' * len(batch))})",
+                [cutoff, *batch],
+            )
+            for item_id, item_build, payload in rows:
+                # A new game build may have changed item details
+                if build is not None and item_build != build:
+                    continue
+                cached[item_id] = json.loads(payload)
+    inc("gw2_cache_requests_total", len(cached), cache="items", result="hit")
+    inc(
+        "gw2_cache_requests_total", len(ids) - len(cached), cache="items", result="miss"
+    )
+    return cached
+
+
+# Function to store freshly fetched item payloads in the cache
+def store_items(items, build=None):
+    if not items:
+        return
+    now = time.time()
+    with _lock, closing(open_item_cache()) as connection, connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO items (id, build, fetched_at, payload) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (item_id, build, now, json.dumps(item))
+                for item_id, item in items.items()
+            ],
+        )
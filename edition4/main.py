@@ -1,138 +1,151 @@
 import shiny
-from shiny import App, ui, reactive, render
+from shiny import App, ui, reactive, render, req
 import os
-import requests
+import numpy as np
 import pandas as pd
-from datetime import datetime, timezone
-
-# Define the item IDs
-ITEM_IDS = [19721, 19976, 24283, 24289, 19701]
-
-# API Endpoints
-ITEMS_ENDPOINT = "https://api.guildwars2.com/v2/items/"
-PRICES_ENDPOINT = "https://api.guildwars2.com/v2/commerce/prices/"
-HISTORY_ENDPOINT = "https://api.datawars2.ie/gw2/v1/history?itemID="
-
-
-# Function to format price as G/S/C (Gold/Silver/Copper)
-def format_price(price_in_copper):
-    gold = price_in_copper // 10000
-    silver = (price_in_copper % 10000) // 100
-    copper = price_in_copper % 100
-    return f"{gold}G {silver}S {copper}C"
-
-
-# Function to fetch 30-entry average price from the historical data API
-def fetch_30_entry_average(item_id):
-    try:
-        history_response = requests.get(f"{HISTORY_ENDPOINT}{item_id}").json()
-
-        # Ensure the datetime is timezone-aware
-        for entry in history_response:
-            entry["date"] = datetime.strptime(
-                entry["date"], "%Y-%m-%dT%H:%M:%S.%fZ"
-            ).replace(tzinfo=timezone.utc)
-
-        # Sort entries by date and get the last 30 entries
-        history_response = sorted(
-            history_response, key=lambda x: x["date"], reverse=True
-        )[:30]
-
-        # Extract the minimum sell prices
-        prices = [
-            entry["sell_price_min"]
-            for entry in history_response
-            if "sell_price_min" in entry
-        ]
-
-        # Calculate and round the average price
-        return round(sum(prices) / len(prices)) if prices else 0
-    except Exception as e:
-        print(f"Error fetching 30-entry average for item ID {item_id}: {e}")
-        return 0
-
-
-# Function to calculate and format profit/loss correctly
-def calculate_price_difference(current_price, average_price_30d):
-    difference = current_price - average_price_30d
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Mount, Route
+from alerts import evaluate_alerts
+from assets import DIST_DIR, AssetFiles, load_asset_manifest
+from broadcast import publish_changes, subscribe
+from catalog import (
+    CATALOG_SEARCH_LIMIT,
+    item_names,
+    search_items,
+    start_catalog_builder,
+)
+from crafting import crafting_table, get_crafting_version, start_crafting_engine
+from market_scan import get_market, rank_market, start_market_scanner
+from market_snapshot import get_top_movers
+from metrics import PROFILING_ENABLED, inc, render_metrics, sample_profile, timed
+from pipeline import (
+    BASELINE_COLUMN,
+    ITEM_COLUMNS,
+    get_sorted_items_data,
+    get_tracked_items_version,
+    load_tracked_items,
+    save_tracked_items,
+)
+from snapshot import (
+    add_refresh_listener,
+    add_snapshot_listener,
+    get_snapshot,
+    get_snapshot_data_version,
+    get_snapshot_version,
+    request_refresh,
+    start_snapshot_refresher,
+)
 
-    # Determine the sign of the difference
-    sign = -1 if difference < 0 else 1
-    difference = abs(difference)
+# Set GW2_MARKET_SCAN=1 to also scan and rank the whole trading post
+MARKET_SCAN_ENABLED = os.environ.get("GW2_MARKET_SCAN") == "1"
+MARKET_RANKINGS = {
+    "margin": "Margin (after fees)",
+    "spread": "Spread",
+    "deviation": "Deviation from Market Avg (30 days of scans)",
+    "gainers": "Top Gainers (since last scan)",
+    "losers": "Top Losers (since last scan)",
+    "gainers_pct": "Top Gainers % (since last scan)",
+    "losers_pct": "Top Losers % (since last scan)",
+}
+
+# Rankings served from the market snapshot, as (measure, direction)
+MOVER_RANKINGS = {
+    "gainers": ("change", "gainers"),
+    "losers": ("change", "losers"),
+    "gainers_pct": ("change_pct", "gainers"),
+    "losers_pct": ("change_pct", "losers"),
+}
+
+# Columns shown as G/S/C, formatted only when a table is rendered
+PRICE_COLUMNS = ["Price", BASELINE_COLUMN]
+SIGNED_PRICE_COLUMNS = ["Profit"]
+
+# Rows per page offered by the item table
+PAGE_SIZES = ["25", "50", "100"]
+
+
+# Function to format a whole column of copper amounts as G/S/C in one pass
+def format_price_column(prices, signed=False):
+    prices = prices.astype("int64")
+    # Signed amounts carry the sign on every unit, e.g. -1G -2S -3C
+    sign = np.where(prices < 0, -1, 1) if signed else 1
+    amount = prices.abs() if signed else prices
+    gold = (amount // 10000) * sign
+    silver = ((amount % 10000) // 100) * sign
+    copper = (amount % 100) * sign
+    return (
+        gold.astype(str) + "G " + silver.astype(str) + "S " + copper.astype(str) + "C"
+    )
 
-    gold = difference // 10000
-    silver = (difference % 10000) // 100
-    copper = difference % 100
 
-    # Adjust for negative profit/loss
-    formatted_difference = f"{sign * gold}G {sign * silver}S {sign * copper}C"
+# Function to build the table of the biggest price moves between two scans
+def movers_frame(by, direction, top=50):
+    movers = get_top_movers(top, by=by, direction=direction)
+    return pd.DataFrame(
+        {
+            "ID": [mover.item_id for mover in movers],
+            "Before": format_price_column(
+                pd.Series([mover.previous for mover in movers], dtype="int64")
+            ),
+            "Now": format_price_column(
+                pd.Series([mover.current for mover in movers], dtype="int64")
+            ),
+            "Change": format_price_column(
+                pd.Series([mover.change for mover in movers], dtype="int64"),
+                signed=True,
+            ),
+            "Change %": [f"{mover.change_pct:+.1f}%" for mover in movers],
+        }
+    )
 
-    return formatted_difference
 
+# Function to format the price columns of the rows about to be displayed
+def format_price_table(df):
+    df = df.copy()
+    for column in PRICE_COLUMNS:
+        df[column] = format_price_column(df[column])
+    for column in SIGNED_PRICE_COLUMNS:
+        df[column] = format_price_column(df[column], signed=True)
+    return df
 
-# Function to fetch item data from the GuildWars2 API
-def fetch_item_data(item_id):
-    try:
-        item_response = requests.get(f"{ITEMS_ENDPOINT}{item_id}").json()
-        price_response = requests.get(f"{PRICES_ENDPOINT}{item_id}").json()
-        current_price = price_response.get("buys", {}).get("unit_price", 0)
-        average_price_30d = fetch_30_entry_average(item_id)
-        price_difference = calculate_price_difference(current_price, average_price_30d)
 
-        item_data = {
-            "ID": item_id,
-            "Name": item_response.get("name", "Unknown"),
-            "PriceRaw": current_price,
-            "Price": format_price(current_price),
-            "Average Price (30 Day Avg)": format_price(average_price_30d),
-            "Profit": price_difference,
-        }
-        return item_data
-    except Exception as e:
-        print(f"Error fetching data for item ID {item_id}: {e}")
-        return None
+# Function to send many cell updates to a data grid in one websocket message.
+# Shiny's update_cell_value sends one message per cell, so its two steps are
+# done here for the whole batch
+async def add_cell_patches(table, patches):
+    processed = table._set_cell_patch_map_patches(patches)
+    await table._send_message_to_browser("addPatches", {"patches": processed})
 
 
-# Function to fetch data for all item IDs and sort by raw price (highest to lowest)
-def get_sorted_items_data():
-    data = [fetch_item_data(item_id) for item_id in ITEM_IDS]
-    data = [d for d in data if d is not None]
-    sorted_data = sorted(data, key=lambda x: x["PriceRaw"], reverse=True)
-    for item in sorted_data:
-        item.pop("PriceRaw")  # Remove raw price after sorting
-    return pd.DataFrame(sorted_data)
+# Function to filter, sort and slice the item table down to one page of rows
+def page_items(
+    df, name_filter="", sort_by="Price", descending=True, page=1, page_size=25
+):
+    if name_filter:
+        df = df[df["Name"].str.contains(name_filter, case=False, regex=False)]
+    df = df.sort_values(sort_by, ascending=not descending, ignore_index=True)
+    pages = max(1, -(-len(df) // page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return df.iloc[start : start + page_size], page, pages, len(df)
 
 
 # Shiny UI
 static_dir = os.path.join(os.path.dirname(__file__), "static")
 
+# Front-end bundles built by build_assets.py and checked in under static/dist,
+# served with long-lived cache headers so the page needs no CDN
+asset_manifest = load_asset_manifest()
+if asset_manifest is None:
+    raise RuntimeError("No front-end bundles in static/dist, run build_assets.py")
+asset_tags = [
+    ui.tags.link(rel="stylesheet", href=f"dist/{asset_manifest['styles.css']}"),
+    ui.tags.script(src=f"dist/{asset_manifest['planet_menu.js']}", defer=True),
+]
+
 app_ui = ui.page_fluid(
-    ui.tags.head(
-        ui.tags.script(src="https://unpkg.com/react@17/umd/react.development.js"),
-        ui.tags.script(src="https://unpkg.com/react-dom@17/umd/react.development.js"),
-        ui.tags.script(src="https://unpkg.com/babel-standalone@6/babel.min.js"),
-        ui.tags.script(src="https://unpkg.com/react-planet@1.0.1/dist/index.umd.js"),
-        ui.tags.link(rel="stylesheet", href="css/styles.css"),
-        ui.tags.script(
-            """
-            function loadReactComponent() {
-                var script = document.createElement('script');
-                script.src = 'js/react_component.js';
-                script.type = 'text/babel';
-                document.body.appendChild(script);
-            }
-            window.onload = function() {
-                console.log('Window loaded');
-                if (typeof ReactPlanet !== 'undefined') {
-                    console.log('ReactPlanet loaded');
-                    loadReactComponent();
-                } else {
-                    console.error('ReactPlanet not loaded');
-                }
-            }
-        """
-        ),
-    ),
+    ui.tags.head(*asset_tags),
     ui.tags.title("Guild Wars 2 - Price Tracker"),
     ui.panel_title(
         ui.h1(
@@ -147,55 +160,394 @@ app_ui = ui.page_fluid(
         style="text-align: center; margin-bottom: 20px;",
     ),
     ui.div(
-        ui.output_ui("item_table"),
+        ui.input_selectize(
+            "tracked_items",
+            "Tracked items",
+            choices=[],
+            multiple=True,
+            width="100%",
+            options={"placeholder": "Search items by name to track them"},
+        ),
+        ui.layout_columns(
+            ui.input_text("item_filter", "Filter by name"),
+            ui.input_select("sort_by", "Sort by", list(ITEM_COLUMNS), selected="Price"),
+            ui.input_switch("descending", "Descending", value=True),
+            ui.input_select("page_size", "Rows per page", PAGE_SIZES),
+        ),
+        ui.input_checkbox_group(
+            "columns",
+            "Columns",
+            list(ITEM_COLUMNS),
+            selected=list(ITEM_COLUMNS),
+            inline=True,
+        ),
+        ui.output_data_frame("item_table"),
+        ui.div(
+            ui.input_action_button("previous_page", "Previous"),
+            ui.output_text("page_info", inline=True),
+            ui.input_action_button("next_page", "Next"),
+            style="display: flex; justify-content: center; align-items: center; gap: 10px; margin-top: 10px;",
+        ),
         style="max-width: 900px; margin: 0 auto; border: 2px solid #ccc; padding: 20px; border-radius: 8px; background-color: #f9f9f9;",
     ),
     ui.div(
         ui.output_text("last_updated", container=ui.h6),
         style="text-align: center; margin-top: 10px;",
     ),
+    (
+        ui.div(
+            ui.h3("Market Scan", style="text-align: center;"),
+            ui.input_select("market_rank", "Rank by", MARKET_RANKINGS),
+            ui.output_ui("market_table"),
+            style="max-width: 900px; margin: 30px auto 0; border: 2px solid #ccc; padding: 20px; border-radius: 8px; background-color: #f9f9f9;",
+        )
+        if MARKET_SCAN_ENABLED
+        else None
+    ),
+    (
+        ui.div(
+            ui.h3("Craft vs Buy", style="text-align: center;"),
+            ui.output_ui("craft_table"),
+            style="max-width: 900px; margin: 30px auto 0; border: 2px solid #ccc; padding: 20px; border-radius: 8px; background-color: #f9f9f9;",
+        )
+        if MARKET_SCAN_ENABLED
+        else None
+    ),
     style="background-color: #FFFFFF; padding: 20px;",
 )
 
 
 def server(input, output, session):
-    # Reactive value to store item data and last update time
-    data_store = reactive.Value(get_sorted_items_data())
-    last_update_time = reactive.Value(
-        datetime.now(timezone.utc).strftime("%I:%M %p UTC")
-    )
+    # All sessions share one snapshot, refreshed by a single background thread
+    start_snapshot_refresher(get_sorted_items_data)
 
-    # Fetch data when the refresh button is clicked
+    # Every data change is diffed once and pushed to the sessions as cell updates
+    add_snapshot_listener(publish_changes)
+
+    # Price alerts are checked once per refresh, by the refreshing process only
+    add_refresh_listener(evaluate_alerts)
+
+    # The item search needs the catalog, built once in the background if missing
+    start_catalog_builder()
+
+    # Count connected sessions for the /metrics route
+    inc("gw2_active_sessions")
+    session.on_ended(lambda: inc("gw2_active_sessions", -1))
+
+    # Reactive snapshot status, re-read whenever the snapshot is touched
+    @reactive.poll(get_snapshot_version, 1)
+    def snapshot_status():
+        return get_snapshot()
+
+    # Reactive snapshot data, re-read only when a refresh actually changed it
+    @reactive.poll(get_snapshot_data_version, 1)
+    def data_store():
+        return get_snapshot()
+
+    # Ask the background thread to refresh when the refresh button is clicked,
+    # so the network wait never blocks the event loop
     @reactive.Effect
     @reactive.event(input.refresh)
     def on_refresh():
-        data_store.set(get_sorted_items_data())
-        last_update_time.set(datetime.now(timezone.utc).strftime("%I:%M %p UTC"))
+        request_refresh()
 
     # Render the last updated time
     @output
     @render.text
     def last_updated():
-        return f"Last Updated: {last_update_time.get()}"
+        snapshot = snapshot_status()
+        updated_at = snapshot["updated_at"]
+        if updated_at is None:
+            return "Last Updated: loading..."
+        status = " (refreshing...)" if snapshot["refreshing"] else ""
+        return f"Last Updated: {updated_at.strftime('%I:%M %p UTC')}{status}"
+
+    # Page the table is showing, reset whenever the rows change order
+    current_page = reactive.Value(1)
 
-    # Render the item table
+    @reactive.Effect
+    @reactive.event(input.item_filter, input.sort_by, input.descending, input.page_size)
+    def reset_page():
+        current_page.set(1)
+
+    @reactive.Effect
+    @reactive.event(input.previous_page)
+    def on_previous_page():
+        current_page.set(max(1, visible_items()[1] - 1))
+
+    @reactive.Effect
+    @reactive.event(input.next_page)
+    def on_next_page():
+        _, page, pages, _ = visible_items()
+        current_page.set(min(pages, page + 1))
+
+    # Filter, sort and page on the server, so only the visible rows are sent
+    @reactive.calc
+    def visible_items():
+        df = data_store()["data"]
+        if df is None:
+            df = pd.DataFrame(columns=list(ITEM_COLUMNS)).astype(ITEM_COLUMNS)
+        rows, page, pages, total = page_items(
+            df,
+            input.item_filter(),
+            input.sort_by(),
+            input.descending(),
+            current_page.get(),
+            int(input.page_size()),
+        )
+        return rows, page, pages, total
+
+    # IDs on the visible page and its position, only set when they change so
+    # new prices for the same rows are pushed as cell updates instead
+    page_layout = reactive.Value(None)
+
+    @reactive.Effect
+    def update_page_layout():
+        rows, page, pages, total = visible_items()
+        layout = (tuple(rows["ID"].tolist()), page, pages, total)
+        with reactive.isolate():
+            if layout != page_layout.get():
+                page_layout.set(layout)
+
+    # Render the page position
     @output
-    @render.ui
+    @render.text
+    def page_info():
+        layout = page_layout.get()
+        req(layout)
+        _, page, pages, total = layout
+        return f"Page {page} of {pages} ({total} items)"
+
+    # Snapshot data, page layout and columns the item table was last rendered with
+    rendered_table = {"data": None, "layout": None, "columns": None}
+
+    # Render the visible page of the item table
+    @output
+    @render.data_frame
     def item_table():
-        df = data_store.get()
-        # Render the table as HTML with the proper layout and styles
-        return ui.HTML(
-            df.to_html(
-                index=False,
-                escape=False,
-                justify="center",
-                classes="table table-striped table-hover",
+        layout = page_layout.get()
+        req(layout)
+        with reactive.isolate():
+            rows = visible_items()[0]
+            data = data_store()["data"]
+        columns = [column for column in ITEM_COLUMNS if column in input.columns()]
+        with timed("gw2_stage_seconds", stage="render"):
+            grid = render.DataGrid(
+                format_price_table(rows)[columns], width="100%", summary=False
+            )
+        rendered_table.update(data=data, layout=layout, columns=columns)
+        return grid
+
+    # Push changed cells of the rows on screen as one batch of cell patches. New
+    # prices that reorder the page are left to the single re-render they cause
+    async def push_changes(changes):
+        # Runs outside the reactive flush, so reads must not take dependencies
+        with reactive.isolate():
+            layout = rendered_table["layout"]
+            df = get_snapshot()["data"]
+            # Nothing to patch before the first render, when the table was
+            # already rendered from this data, or while the table is hidden
+            if layout is None or df is None or df is rendered_table["data"]:
+                return
+            if session.clientdata.output_hidden("item_table"):
+                return
+            rows, page, pages, total = page_items(
+                df,
+                input.item_filter(),
+                input.sort_by(),
+                input.descending(),
+                current_page.get(),
+                int(input.page_size()),
             )
+            if (tuple(rows["ID"].tolist()), page, pages, total) != layout:
+                return
+            positions = {item_id: row for row, item_id in enumerate(layout[0])}
+            columns = rendered_table["columns"]
+            shown = [item_id for item_id in changes if item_id in positions]
+            formatted = format_price_table(rows[rows["ID"].isin(shown)])
+            formatted = formatted.set_index("ID", drop=False)
+            patches = [
+                {
+                    "row_index": positions[item_id],
+                    "column_index": columns.index(column),
+                    "value": formatted.at[item_id, column],
+                }
+                for item_id in shown
+                for column in changes[item_id]
+                if column in columns
+            ]
+            if patches:
+                await add_cell_patches(item_table, patches)
+                inc("gw2_pushed_cells_total", len(patches))
+
+    session.on_ended(subscribe(push_changes))
+
+    # Function to label the tracked items, by the catalog or the loaded rows
+    def tracked_choices():
+        tracked = load_tracked_items()
+        names = item_names(tracked)
+        df = get_snapshot()["data"]
+        if df is not None:
+            shown = dict(zip(df["ID"].tolist(), df["Name"].tolist()))
+            names = {**shown, **names}
+        return [
+            {"value": str(item_id), "label": names.get(item_id, f"Item {item_id}")}
+            for item_id in tracked
+        ]
+
+    # Typeahead for the tracked items selectize, searched in the item catalog.
+    # The tracked items are always included so they stay selected
+    def search_tracked_items(request):
+        choices = tracked_choices()
+        tracked = {choice["value"] for choice in choices}
+        for item_id, name in search_items(
+            request.query_params.get("query", ""), CATALOG_SEARCH_LIMIT
+        ):
+            if str(item_id) not in tracked:
+                choices.append({"value": str(item_id), "label": name})
+        return JSONResponse(choices)
+
+    # Selectize loads its options from the search route instead of the page
+    search_url = session.dynamic_route("tracked_items", search_tracked_items)
+
+    # Tracked items as last shown in or saved from this session
+    shown_tracked = {"items": None}
+
+    # Tracked items shared by every session, re-read whenever any session or
+    # worker process saves them
+    @reactive.poll(get_tracked_items_version, 2)
+    def tracked_store():
+        return load_tracked_items()
+
+    # Show the current tracked items, also after another session changed them,
+    # so an edit here never saves a stale list over theirs
+    @reactive.effect
+    def show_tracked_items():
+        tracked = tracked_store()
+        if tracked == shown_tracked["items"]:
+            return
+        shown_tracked["items"] = tracked
+        # Any message with a search URL, even the same one, makes selectize
+        # clear and reload its options, then select the value
+        session.send_input_message(
+            "tracked_items",
+            {"url": search_url, "value": [str(item_id) for item_id in tracked]},
         )
 
+    # Save the chosen items for every worker and refresh the prices right away
+    @reactive.effect
+    @reactive.event(input.tracked_items)
+    def update_tracked_items():
+        selected = [int(item_id) for item_id in input.tracked_items()]
+        # Selectize empties the input while it reloads, keep at least one item
+        if selected and selected != load_tracked_items():
+            save_tracked_items(selected)
+            shown_tracked["items"] = selected
+            request_refresh()
+
+    if MARKET_SCAN_ENABLED:
+        start_market_scanner()
+        start_crafting_engine()
+
+        # Reactive market table, re-read only after a new scan
+        @reactive.poll(lambda: get_market()["scanned_at"], 5)
+        def market_store():
+            return get_market()["table"]
+
+        # Render the top of the market for the selected ranking
+        @output
+        @render.ui
+        def market_table():
+            table = market_store()
+            if table is None:
+                return ui.p("Scanning the trading post...", style="text-align: center;")
+            if input.market_rank() in MOVER_RANKINGS:
+                df = movers_frame(*MOVER_RANKINGS[input.market_rank()])
+                if df.empty:
+                    return ui.p(
+                        "No price moves since the last scan.",
+                        style="text-align: center;",
+                    )
+                return ui.HTML(
+                    df.to_html(
+                        index=False,
+                        escape=False,
+                        justify="center",
+                        classes="table table-striped table-hover",
+                    )
+                )
+            ranked = rank_market(table, by=input.market_rank())
+            df = pd.DataFrame(
+                {
+                    "ID": ranked["id"],
+                    "Buy Price": format_price_column(ranked["buy_price"]),
+                    "Sell Price": format_price_column(ranked["sell_price"]),
+                    "Spread": format_price_column(ranked["spread"], signed=True),
+                    "Margin": format_price_column(ranked["margin"], signed=True),
+                }
+            )
+            if "deviation" in ranked:
+                df["Deviation"] = (ranked["deviation"] * 100).map("{:+.1f}%".format)
+            return ui.HTML(
+                df.to_html(
+                    index=False,
+                    escape=False,
+                    justify="center",
+                    classes="table table-striped table-hover",
+                )
+            )
+
+        # Reactive crafting costs, re-read whenever the engine updates them
+        @reactive.poll(get_crafting_version, 5)
+        def crafting_store():
+            return crafting_table()
+
+        # Render the items that are cheaper to craft than to buy
+        @output
+        @render.ui
+        def craft_table():
+            table = crafting_store()
+            if table.empty:
+                return ui.p("Loading recipes...", style="text-align: center;")
+            df = pd.DataFrame(
+                {
+                    "ID": table["id"],
+                    "Buy Price": format_price_column(table["buy_price"]),
+                    "Craft Cost": format_price_column(table["craft_cost"]),
+                    "Saving": format_price_column(table["saving"], signed=True),
+                    "Recipe": table["recipe_id"],
+                }
+            )
+            return ui.HTML(
+                df.to_html(
+                    index=False,
+                    escape=False,
+                    justify="center",
+                    classes="table table-striped table-hover",
+                )
+            )
+
+
+# Prometheus metrics for the whole process
+def metrics_endpoint(request):
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+# Sampling profile of every thread, e.g. /debug/profile?seconds=10
+def profile_endpoint(request):
+    seconds = min(float(request.query_params.get("seconds", 10)), 60)
+    return PlainTextResponse(sample_profile(seconds))
+
+
+# Run the App, with the metrics routes mounted next to it
+shiny_app = App(app_ui, server, static_assets=static_dir)
 
-# Run the App
-app = App(app_ui, server, static_assets=static_dir)
+routes = [Route("/metrics", metrics_endpoint)]
+if PROFILING_ENABLED:
+    routes.append(Route("/debug/profile", profile_endpoint))
+routes.append(Mount("/dist", app=AssetFiles(directory=DIST_DIR, check_dir=False)))
+routes.append(Mount("/", app=shiny_app))
+app = Starlette(routes=routes)
 
 if __name__ == "__main__":
     shiny.run_app(app)
@@ -0,0 +1,197 @@
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from gw2api import PRICES_ENDPOINT, chunk_ids, fetch_chunk
+from http_client import get, get_executor
+from market_snapshot import SNAPSHOT_COLUMNS, update_market_snapshot
+from shared_store import (
+    SHARED_POLL_INTERVAL,
+    acquire_leadership,
+    read_shared_frame,
+    read_shared_meta,
+    write_shared_frame,
+)
+
+# Seconds between scheduled scans of the whole trading post
+MARKET_SCAN_INTERVAL = int(os.environ.get("GW2_MARKET_SCAN_INTERVAL", "600"))
+
+# A full scan costs about 140 requests, so never scan more often than this
+MIN_MARKET_SCAN_INTERVAL = 60
+
+# Sellers receive 85% of the sale price after the 5% listing and 10% exchange fees
+SELLER_SHARE = 0.85
+
+# Columns of the compact market table and their dtypes
+MARKET_COLUMNS = {
+    "id": "int32",
+    "buy_price": "int32",
+    "buy_quantity": "int32",
+    "sell_price": "int32",
+    "sell_quantity": "int32",
+}
+
+# Seconds of scans the market-wide baseline price averages over, the deviation
+# ranking compares the current buy price against it
+DEVIATION_WINDOW = 30 * 24 * 60 * 60
+
+# Name of the market table shared by every worker process
+MARKET_NAME = "market"
+
+_market = {"table": None, "scanned_at": None}
+_lock = threading.Lock()
+_scanner = {"thread": None, "followed": None}
+
+
+# Function to list every item ID that is tradable on the trading post
+def fetch_tradable_ids():
+    response = get(PRICES_ENDPOINT)
+    response.raise_for_status()
+    return response.json()
+
+
+# Function to turn one chunk of price entries into compact rows
+def price_rows(entries):
+    return [
+        (
+            entry["id"],
+            entry.get("buys", {}).get("unit_price", 0),
+            entry.get("buys", {}).get("quantity", 0),
+            entry.get("sells", {}).get("unit_price", 0),
+            entry.get("sells", {}).get("quantity", 0),
+        )
+        for entry in entries
+    ]
+
+
+# Function to fetch one chunk of prices, reduced to tuples as soon as it arrives
+def fetch_price_rows(chunk):
+    return price_rows(fetch_chunk(PRICES_ENDPOINT, chunk))
+
+
+# Function to get the previous market table and when it was scanned, read from
+# the table last published to the other workers after a restart
+def previous_market():
+    market = get_market()
+    if market["table"] is not None:
+        return market["table"], market["scanned_at"]
+    meta = read_shared_meta(MARKET_NAME)
+    if meta is None or meta.get("frame") is None:
+        return None, None
+    try:
+        return read_shared_frame(MARKET_NAME, meta), meta["scanned_at"]
+    except (OSError, KeyError, ValueError):
+        return None, None
+
+
+# Function to move every item's baseline toward its current buy price, as an
+# exponential average weighted by the time since the previous scan. New items
+# start at their price and items nobody is buying keep their baseline
+def update_baseline(table, previous, elapsed):
+    price = table["buy_price"].astype("float64")
+    if previous is None or "baseline" not in previous:
+        return price
+    before = table["id"].map(previous.set_index("id")["baseline"])
+    weight = 1 - np.exp(-max(elapsed, 0) / DEVIATION_WINDOW)
+    baseline = (before + weight * (price - before)).where(before > 0, price)
+    return baseline.where(price > 0, before.fillna(0))
+
+
+# Function to fetch prices for the whole trading post into a compact table
+def scan_market():
+    previous, previous_scanned_at = previous_market()
+    ids = fetch_tradable_ids()
+    executor = get_executor(PRICES_ENDPOINT)
+    futures = [executor.submit(fetch_price_rows, chunk) for chunk in chunk_ids(ids)]
+    rows = [row for future in futures for row in future.result()]
+    table = pd.DataFrame(rows, columns=list(MARKET_COLUMNS)).astype(MARKET_COLUMNS)
+    table["spread"] = table["sell_price"] - table["buy_price"]
+    table["margin"] = (
+        np.floor(table["sell_price"] * SELLER_SHARE).astype("int32")
+        - table["buy_price"]
+    )
+    scanned_at = time.time()
+    elapsed = scanned_at - (previous_scanned_at or scanned_at)
+    table["baseline"] = update_baseline(table, previous, elapsed)
+    store_market(table, scanned_at)
+    return table
+
+
+# Function to publish a scanned market table and diff it against the last scan
+def store_market(table, scanned_at):
+    update_market_snapshot(
+        table["id"].to_numpy(),
+        {column: table[column].to_numpy() for column in SNAPSHOT_COLUMNS},
+    )
+    with _lock:
+        _market["table"] = table
+        _market["scanned_at"] = scanned_at
+
+
+# Function to rank the scanned market by spread, margin or deviation from the
+# market-wide baseline price
+def rank_market(table, by="margin", top=50):
+    if by == "deviation":
+        table = table[(table["buy_price"] > 0) & (table["baseline"] > 0)]
+        table = table.assign(
+            deviation=(table["buy_price"] - table["baseline"]) / table["baseline"]
+        )
+        return (
+            table.assign(abs_deviation=table["deviation"].abs())
+            .nlargest(top, "abs_deviation")
+            .drop(columns="abs_deviation")
+        )
+    if by not in ("spread", "margin"):
+        raise ValueError(f"Unknown market ranking: {by}")
+    # Items nobody is buying have no meaningful spread or margin
+    table = table[table["buy_price"] > 0]
+    return table.nlargest(top, by)
+
+
+# Function to mirror the market table another worker process scanned
+def follow_market():
+    meta = read_shared_meta(MARKET_NAME)
+    if meta is None or meta.get("frame") in (None, _scanner["followed"]):
+        return
+    store_market(read_shared_frame(MARKET_NAME, meta), meta["scanned_at"])
+    _scanner["followed"] = meta["frame"]
+
+
+# Function run by the background thread, one process is elected to scan on an
+# interval while the others follow the table it publishes
+def _scan_loop(interval):
+    while True:
+        if acquire_leadership(MARKET_NAME):
+            try:
+                table = scan_market()
+                write_shared_frame(
+                    MARKET_NAME, table, scanned_at=get_market()["scanned_at"]
+                )
+            except Exception as e:
+                print(f"Error scanning market: {e}")
+            time.sleep(interval)
+        else:
+            try:
+                follow_market()
+            except Exception as e:
+                print(f"Error reading shared market table: {e}")
+            time.sleep(SHARED_POLL_INTERVAL)
+
+
+# Function to start the scheduled market scan once per process
+def start_market_scanner(interval=MARKET_SCAN_INTERVAL):
+    interval = max(interval, MIN_MARKET_SCAN_INTERVAL)
+    with _lock:
+        if _scanner["thread"] is not None:
+            return
+        _scanner["thread"] = threading.Thread(
+            target=_scan_loop, args=(interval,), name="market-scanner", daemon=True
+        )
+        _scanner["thread"].start()
+
+
+# Function to get the latest market table and when it was scanned
+def get_market():
+    with _lock:
+        return dict(_market)
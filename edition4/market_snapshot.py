@@ -0,0 +1,145 @@
+import threading
+import numpy as np
+
+# Price columns kept for every item, as parallel int32 arrays
+SNAPSHOT_COLUMNS = ("buy_price", "buy_quantity", "sell_price", "sell_quantity")
+
+# Price the movers are measured on, the dashboard's "Price" is the buy price
+MOVER_PRICE = "buy_price"
+
+# Movers kept ready after every tick, larger requests are computed on demand
+MOVERS_TOP_N = 50
+MOVER_MEASURES = ("change", "change_pct")
+MOVER_DIRECTIONS = ("gainers", "losers")
+
+# Items by position: the sorted item IDs and a dense ID -> position lookup.
+# "current" and "previous" are double buffers, a tick writes into the older
+# one and swaps, so the arrays are only reallocated when new items appear
+_snapshot = {
+    "ids": np.empty(0, dtype="int32"),
+    "slots": np.empty(0, dtype="int32"),
+    "current": {column: np.empty(0, dtype="int32") for column in SNAPSHOT_COLUMNS},
+    "previous": {column: np.empty(0, dtype="int32") for column in SNAPSHOT_COLUMNS},
+    "change": np.empty(0, dtype="int64"),
+    "change_pct": np.empty(0, dtype="float64"),
+    "movers": {},
+    "ticks": 0,
+}
+_lock = threading.Lock()
+
+
+# One item's price move between the last two ticks
+class Mover:
+    __slots__ = ("item_id", "previous", "current", "change", "change_pct")
+
+    def __init__(self, item_id, previous, current, change, change_pct):
+        self.item_id = item_id
+        self.previous = previous
+        self.current = current
+        self.change = change
+        self.change_pct = change_pct
+
+    def __repr__(self):
+        return f"Mover({self.item_id}, {self.previous} -> {self.current})"
+
+
+# Function to add new item IDs to the index, moving both buffers to the new
+# positions (only needed when the trading post lists new items)
+def _grow_index(ids):
+    known, slots = _snapshot["ids"], _snapshot["slots"]
+    # Usual case: every ID already has a position, checked with the lookup
+    if len(ids) and ids.max() < len(slots) and (slots[ids] >= 0).all():
+        return
+    new_ids = np.setdiff1d(ids, known)
+    if not len(new_ids):
+        return
+    all_ids = np.union1d(known, new_ids).astype("int32")
+    positions = np.searchsorted(all_ids, known)
+    for buffer in ("current", "previous"):
+        for column, values in _snapshot[buffer].items():
+            grown = np.zeros(len(all_ids), dtype="int32")
+            grown[positions] = values
+            _snapshot[buffer][column] = grown
+    slots = np.full(int(all_ids[-1]) + 1, -1, dtype="int32")
+    slots[all_ids] = np.arange(len(all_ids), dtype="int32")
+    _snapshot["ids"] = all_ids
+    _snapshot["slots"] = slots
+
+
+# Function to get the positions of the largest values, largest first, with a
+# linear-time partition instead of sorting every item
+def top_positions(values, top):
+    top = min(top, len(values))
+    if top == 0:
+        return np.empty(0, dtype="int64")
+    positions = np.argpartition(values, -top)[-top:]
+    positions = positions[np.argsort(values[positions])[::-1]]
+    return positions[values[positions] > 0]
+
+
+# Function to turn positions into Mover records
+def _movers(positions):
+    ids = _snapshot["ids"]
+    before = _snapshot["previous"][MOVER_PRICE]
+    after = _snapshot["current"][MOVER_PRICE]
+    return [
+        Mover(
+            int(ids[p]),
+            int(before[p]),
+            int(after[p]),
+            int(_snapshot["change"][p]),
+            float(_snapshot["change_pct"][p]),
+        )
+        for p in positions
+    ]
+
+
+# Function to compute the top gainers and losers by change and percent change
+def _rank_movers(top):
+    change, change_pct = _snapshot["change"], _snapshot["change_pct"]
+    return {
+        ("change", "gainers"): _movers(top_positions(change, top)),
+        ("change", "losers"): _movers(top_positions(-change, top)),
+        ("change_pct", "gainers"): _movers(top_positions(change_pct, top)),
+        ("change_pct", "losers"): _movers(top_positions(-change_pct, top)),
+    }
+
+
+# Function to record a market scan as the current tick and diff it against
+# the previous one
+def update_market_snapshot(ids, columns):
+    ids = np.asarray(ids, dtype="int32")
+    with _lock:
+        _grow_index(ids)
+        # The previous buffer is overwritten with the new tick, then swapped in
+        current, previous = _snapshot["previous"], _snapshot["current"]
+        positions = _snapshot["slots"][ids]
+        for column in SNAPSHOT_COLUMNS:
+            current[column].fill(0)
+            current[column][positions] = columns[column]
+        _snapshot["current"], _snapshot["previous"] = current, previous
+
+        # Only items priced in both ticks have moved
+        before = previous[MOVER_PRICE].astype("int64")
+        after = current[MOVER_PRICE].astype("int64")
+        moved = (before > 0) & (after > 0)
+        _snapshot["change"] = np.where(moved, after - before, 0)
+        _snapshot["change_pct"] = np.divide(
+            _snapshot["change"] * 100.0,
+            before,
+            out=np.zeros(len(before)),
+            where=moved,
+        )
+        _snapshot["movers"] = _rank_movers(MOVERS_TOP_N)
+        _snapshot["ticks"] += 1
+
+
+# Function to get the items that rose ("gainers") or fell ("losers") the most
+# since the previous tick, by copper ("change") or percent ("change_pct")
+def get_top_movers(top=20, by="change", direction="gainers"):
+    if by not in MOVER_MEASURES or direction not in MOVER_DIRECTIONS:
+        raise ValueError(f"Unknown movers ranking: {by} {direction}")
+    with _lock:
+        if top <= MOVERS_TOP_N:
+            return _snapshot["movers"].get((by, direction), [])[:top]
+        return _rank_movers(top)[(by, direction)]
@@ -0,0 +1,148 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Set GW2_PROFILING=1 to expose the sampling profiler at /debug/profile
+PROFILING_ENABLED = os.environ.get("GW2_PROFILING") == "1"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7)
+
+# Every exported metric as name: (type, help, histogram buckets)
+METRICS = {
+    "gw2_upstream_request_seconds": (
+        "histogram",
+        "Upstream request latency by endpoint and status.",
+        LATENCY_BUCKETS,
+    ),
+    "gw2_upstream_payload_bytes": (
+        "histogram",
+        "Upstream response body size by endpoint.",
+        SIZE_BUCKETS,
+    ),
+    "gw2_cache_requests_total": (
+        "counter",
+        "Cache lookups by cache and result (hit or miss).",
+        None,
+    ),
+    "gw2_refresh_seconds": (
+        "histogram",
+        "Duration of a full price snapshot refresh.",
+        LATENCY_BUCKETS,
+    ),
+    "gw2_stage_seconds": (
+        "histogram",
+        "Duration of each pipeline stage (fetch, analytics, build, render).",
+        LATENCY_BUCKETS,
+    ),
+    "gw2_active_sessions": ("gauge", "Connected Shiny sessions.", None),
+    "gw2_alerts_total": ("counter", "Price alert notifications written.", None),
+    "gw2_pushed_cells_total": (
+        "counter",
+        "Table cells pushed to sessions as live updates.",
+        None,
+    ),
+}
+
+_values = {name: {} for name in METRICS}
+_lock = threading.Lock()
+
+
+# Function to turn keyword labels into a hashable, ordered key
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+# Function to add to a counter or gauge
+def inc(name, amount=1, **labels):
+    key = _label_key(labels)
+    with _lock:
+        _values[name][key] = _values[name].get(key, 0) + amount
+
+
+# Function to record one observation in a histogram
+def observe(name, value, **labels):
+    buckets = METRICS[name][2]
+    key = _label_key(labels)
+    with _lock:
+        series = _values[name].setdefault(
+            key, {"buckets": [0] * len(buckets), "sum": 0.0, "count": 0}
+        )
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                series["buckets"][i] += 1
+        series["sum"] += value
+        series["count"] += 1
+
+
+# Context manager timing a block into a latency histogram
+@contextmanager
+def timed(name, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+# Function to format labels in the Prometheus text format
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        k
+        + '="'
+        + v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        + '"'
+        for k, v in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+# Function to render every metric in the Prometheus text exposition format
+def render_metrics():
+    lines = []
+    with _lock:
+        for name, (kind, help_text, buckets) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(_values[name].items()):
+                if kind != "histogram":
+                    lines.append(f"{name}{_format_labels(key)} {value}")
+                    continue
+                for bound, count in zip(buckets, value["buckets"]):
+                    labels = _format_labels(key, [("le", f"{bound:g}")])
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = _format_labels(key, [("le", "+Inf")])
+                lines.append(f"{name}_bucket{labels} {value['count']}")
+                lines.append(f"{name}_sum{_format_labels(key)} {value['sum']}")
+                lines.append(f"{name}_count{_format_labels(key)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# Function to sample every thread's stack for a while, returned as collapsed
+# stacks ("frame;frame;frame count") ready for flame graph tools
+def sample_profile(seconds=10, interval=0.005):
+    samples = Counter()
+    me = threading.get_ident()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == me:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                )
+                frame = frame.f_back
+            samples[";".join(reversed(stack))] += 1
+        time.sleep(interval)
+    return (
+        "\n".join(f"{stack} {count}" for stack, count in samples.most_common()) + "\n"
+    )
@@ -0,0 +1,208 @@
+import json
+import os
+from gw2api import fetch_items_and_prices
+from history_store import (
+    get_history_executor,
+    load_history_rows,
+    load_recent_history,
+    sync_item_history,
+)
+from item_cache import CACHE_DIR, replace_file
+from metrics import inc, timed
+
+# pandas and the analytics module are only imported by the functions that
+# build DataFrames, so batch jobs importing this module start quickly
+
+# Items tracked until others are chosen in the dashboard's item search
+ITEM_IDS = [19721, 19976, 24283, 24289, 19701]
+
+# The chosen items, shared by every worker process and kept across restarts
+TRACKED_ITEMS_PATH = os.path.join(CACHE_DIR, "tracked_items.json")
+
+# History statistic the profit column is measured against, any column of
+# compute_history_stats works (e.g. "sell_median_30" or "sell_mean_7")
+PROFIT_BASELINE = "sell_mean_30"
+
+# Header each history statistic is shown under, filled in with the measure
+# and the window of the statistic's name
+MEASURE_WORDS = {"sell": "Price", "spread": "Spread"}
+STATISTIC_LABELS = {
+    "mean": "Average {measure} ({window} Day Avg)",
+    "median": "Median {measure} ({window} Day Median)",
+    "std": "{measure} Volatility ({window} Day Std Dev)",
+    "min": "Lowest {measure} ({window} Day Min)",
+    "max": "Highest {measure} ({window} Day Max)",
+}
+
+
+# Function to label a history statistic, "sell_mean_30" reads
+# "Average Price (30 Day Avg)" since DataWars2 keeps one entry per day
+def statistic_label(statistic):
+    measure, name, window = statistic.split("_")
+    return STATISTIC_LABELS[name].format(measure=MEASURE_WORDS[measure], window=window)
+
+
+# Column holding the profit baseline, named after whichever statistic it is
+BASELINE_COLUMN = statistic_label(PROFIT_BASELINE)
+
+# Result of the previous refresh, reused when nothing upstream changed
+_previous = {"ids": None, "baselines": None, "row_hashes": None, "data": None}
+
+# Item table columns, prices are kept as integer copper until rendering
+ITEM_COLUMNS = {
+    "ID": "int32",
+    "Name": "string",
+    "Price": "int64",
+    BASELINE_COLUMN: "int64",
+    "Profit": "int64",
+}
+
+
+# Function to bring an item's local history up to date from the historical data API
+def sync_history(item_id):
+    try:
+        # Only entries newer than the local history store are downloaded
+        return sync_item_history(item_id)
+    except Exception as e:
+        # Fall back to whatever history is already stored
+        print(f"Error fetching history for item ID {item_id}: {e}")
+        return 0
+
+
+# Function to fetch 30-entry average price from the historical data API
+def fetch_30_entry_average(item_id):
+    sync_history(item_id)
+
+    try:
+        # Extract the minimum sell prices of the last 30 entries
+        prices = load_recent_history(item_id, 30, "sell_price_min")
+
+        # Calculate and round the average price
+        return round(sum(prices) / len(prices)) if prices else 0
+    except Exception as e:
+        print(f"Error reading 30-entry average for item ID {item_id}: {e}")
+        return 0
+
+
+# Function to build one item row from its bulk-fetched item and price entries
+def fetch_item_data(item_id, item_response, price_response, baseline):
+    try:
+        current_price = price_response.get("buys", {}).get("unit_price", 0)
+
+        item_data = {
+            "ID": item_id,
+            "Name": item_response.get("name", "Unknown"),
+            "Price": current_price,
+            BASELINE_COLUMN: baseline,
+            "Profit": current_price - baseline,
+        }
+        return item_data
+    except Exception as e:
+        print(f"Error fetching data for item ID {item_id}: {e}")
+        return None
+
+
+# Function to compute every item's profit baseline from its stored history
+def load_baselines(item_ids):
+    from analytics import compute_history_stats
+
+    return compute_history_stats(item_ids)[PROFIT_BASELINE]
+
+
+# Function to build the item rows from bulk-fetched items and prices
+def build_item_rows(items_and_prices, baselines):
+    data = [
+        fetch_item_data(item_id, item_response, price_response, int(baselines[item_id]))
+        for item_id, (item_response, price_response) in items_and_prices.items()
+    ]
+    return [d for d in data if d is not None]
+
+
+# Function to sync the history of every item in parallel, returning how many
+# entries were new or changed
+def sync_all_history(item_ids):
+    executor = get_history_executor()
+    return sum(executor.map(sync_history, item_ids))
+
+
+# Function to load the tracked item IDs
+def load_tracked_items():
+    try:
+        with open(TRACKED_ITEMS_PATH) as file:
+            return [int(item_id) for item_id in json.load(file)]
+    except (OSError, ValueError):
+        return list(ITEM_IDS)
+
+
+# Function to get a version of the tracked item IDs that changes whenever any
+# process saves them, cheap enough to poll
+def get_tracked_items_version():
+    try:
+        return os.stat(TRACKED_ITEMS_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Function to replace the tracked item IDs, written atomically for the workers
+def save_tracked_items(item_ids):
+    item_ids = list(dict.fromkeys(int(item_id) for item_id in item_ids))
+    replace_file(TRACKED_ITEMS_PATH, lambda file: json.dump(item_ids, file))
+
+
+# Function to fetch data for all item IDs and sort by price (highest to lowest)
+def get_sorted_items_data(item_ids=None):
+    import pandas as pd
+
+    item_ids = list(load_tracked_items() if item_ids is None else item_ids)
+
+    # Start every history request, then fetch items and prices alongside them.
+    # Each host has its own pool, so the price chunks never queue behind syncs
+    with timed("gw2_stage_seconds", stage="fetch"):
+        executor = get_history_executor()
+        syncs = [executor.submit(sync_history, item_id) for item_id in item_ids]
+        items_and_prices = fetch_items_and_prices(item_ids)
+        history_changed = sum(sync.result() for sync in syncs) > 0
+
+    # Statistics for every item come from one vectorized pass over the history,
+    # skipped when no history entry changed since the previous refresh
+    baselines = _previous["baselines"]
+    if history_changed or baselines is None or _previous["ids"] != item_ids:
+        inc("gw2_cache_requests_total", cache="history_stats", result="miss")
+        with timed("gw2_stage_seconds", stage="analytics"):
+            baselines = load_baselines(item_ids)
+    else:
+        inc("gw2_cache_requests_total", cache="history_stats", result="hit")
+
+    with timed("gw2_stage_seconds", stage="build"):
+        data = build_item_rows(items_and_prices, baselines)
+
+    # When no row's content changed, hand back the previous table untouched
+    row_hashes = {row["ID"]: hash(tuple(row.values())) for row in data}
+    if row_hashes == _previous["row_hashes"]:
+        return _previous["data"]
+
+    df = pd.DataFrame(data, columns=list(ITEM_COLUMNS)).astype(ITEM_COLUMNS)
+    df = df.sort_values("Price", ascending=False, ignore_index=True)
+    _previous.update(ids=item_ids, baselines=baselines, row_hashes=row_hashes, data=df)
+    return df
+
+
+# Function to build plain item rows for batch exports, with the same baseline
+# and columns as the dashboard's item table
+def export_item_rows(item_ids=None):
+    item_ids = list(load_tracked_items() if item_ids is None else item_ids)
+    executor = get_history_executor()
+    syncs = [executor.submit(sync_history, item_id) for item_id in item_ids]
+    items_and_prices = fetch_items_and_prices(item_ids)
+    for sync in syncs:
+        sync.result()
+
+    data = build_item_rows(items_and_prices, load_baselines(item_ids))
+    return sorted(data, key=lambda row: row["Price"], reverse=True)
+
+
+# Function to sync and load the stored history of many items for batch exports
+def export_history_rows(item_ids=None, limit=None):
+    item_ids = list(load_tracked_items() if item_ids is None else item_ids)
+    sync_all_history(item_ids)
+    return load_history_rows(item_ids, limit)
@@ -0,0 +1,114 @@
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from item_cache import CACHE_DIR, replace_file
+
+try:
+    import fcntl
+except ImportError:  # No flock on Windows, every process refreshes on its own
+    fcntl = None
+
+# Snapshots shared by every worker process serving the app
+SHARED_DIR = os.path.join(CACHE_DIR, "shared")
+
+# Seconds between followers checking a shared snapshot for updates
+SHARED_POLL_INTERVAL = 1
+
+# Lock files held by this process, one per snapshot it refreshes
+_leases = {}
+
+# Last metadata this process wrote for each snapshot
+_written = {}
+
+
+# Function to build the path of one of a snapshot's files
+def shared_path(name, suffix):
+    return os.path.join(SHARED_DIR, f"{name}{suffix}")
+
+
+# Function to try to become the one process refreshing a snapshot, the lock
+# is held until the process exits so a follower takes over when it dies
+def acquire_leadership(name):
+    if name in _leases or fcntl is None:
+        return True
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    lock_file = open(shared_path(name, ".lock"), "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _leases[name] = lock_file
+    return True
+
+
+# Function to update a snapshot's metadata, fields not given keep their value
+def write_shared_meta(name, **fields):
+    meta = {**_written.get(name, {}), **fields}
+    replace_file(shared_path(name, ".json"), lambda file: json.dump(meta, file))
+    _written[name] = meta
+
+
+# Function to read a snapshot's metadata, None before the first write
+def read_shared_meta(name):
+    try:
+        with open(shared_path(name, ".json")) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+# Function to convert a DataFrame to a fixed-width record array
+def frame_records(df):
+    fields = []
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_numeric_dtype(dtype):
+            fields.append((column, dtype.str))
+        else:
+            width = int(df[column].astype(str).str.len().max()) if len(df) else 1
+            fields.append((column, f"U{max(width, 1)}"))
+    records = np.empty(len(df), dtype=fields)
+    for column, _ in fields:
+        records[column] = df[column].to_numpy()
+    return records
+
+
+# Function to publish a DataFrame and its metadata to the other workers
+def write_shared_frame(name, df, **fields):
+    records = frame_records(df)
+    replace_file(shared_path(name, ".npy"), lambda file: np.save(file, records), "wb")
+    dtypes = {column: str(dtype) for column, dtype in df.dtypes.items()}
+    # A new token tells followers the frame file was replaced
+    write_shared_meta(name, frame=time.time_ns(), dtypes=dtypes, **fields)
+
+
+# Function to load a published DataFrame, the record file is memory-mapped so
+# every worker reads the same pages from the OS cache. Numeric columns are views
+# into the mapping, only text columns are converted into memory
+def read_shared_frame(name, meta):
+    records = np.load(shared_path(name, ".npy"), mmap_mode="r")
+    columns = {}
+    for column, dtype in meta["dtypes"].items():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        values = records[column]
+        columns[column] = values if values.dtype == dtype else pd.array(values, dtype)
+    return pd.DataFrame(columns, copy=False)
+
+
+# Function to ask the refreshing process for an immediate refresh
+def request_shared_refresh(name):
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    path = shared_path(name, ".request")
+    with open(path, "a"):
+        pass
+    os.utime(path)
+
+
+# Function to check whether a refresh was requested after the given time
+def shared_refresh_requested(name, since):
+    try:
+        return os.path.getmtime(shared_path(name, ".request")) > since
+    except OSError:
+        return False
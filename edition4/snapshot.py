@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from metrics import timed
+from shared_store import (
+    SHARED_POLL_INTERVAL,
+    acquire_leadership,
+    read_shared_frame,
+    read_shared_meta,
+    request_shared_refresh,
+    shared_refresh_requested,
+    write_shared_frame,
+    write_shared_meta,
+)
+
+# Seconds between background refreshes of the shared price snapshot
+REFRESH_INTERVAL = int(os.environ.get("GW2_REFRESH_INTERVAL", "300"))
+
+# Name of the snapshot shared by every worker process
+SNAPSHOT_NAME = "prices"
+
+# One snapshot per process, shared by every session
+# "version" changes on every update, "data_version" only when the data itself does
+_snapshot = {
+    "data": None,
+    "updated_at": None,
+    "refreshing": False,
+    "version": 0,
+    "data_version": 0,
+}
+_lock = threading.Lock()
+_wake = threading.Event()
+_refresher = {"thread": None, "loader": None, "followed": None}
+
+# Callbacks run with the previous and the new data whenever the data changes
+_listeners = []
+
+# Callbacks run the same way, but only in the process that refreshed the data
+_refresh_listeners = []
+
+
+# Function to update snapshot fields and bump the version sessions poll on
+def _publish(**fields):
+    with _lock:
+        previous = _snapshot["data"]
+        changed = "data" in fields and fields["data"] is not previous
+        if changed:
+            _snapshot["data_version"] += 1
+        _snapshot.update(fields)
+        _snapshot["version"] += 1
+    if changed:
+        for listener in _listeners:
+            try:
+                listener(previous, fields["data"])
+            except Exception as e:
+                print(f"Error notifying snapshot listener: {e}")
+
+
+# Function to register a callback for every change of the snapshot data
+def add_snapshot_listener(listener):
+    with _lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+# Function to register a callback for data changes, run once per refresh however
+# many worker processes follow the snapshot
+def add_refresh_listener(listener):
+    with _lock:
+        if listener not in _refresh_listeners:
+            _refresh_listeners.append(listener)
+
+
+# Function to fetch fresh data and publish it as the shared snapshot, a loader
+# returning the same object as before marks the data as unchanged
+def refresh_snapshot():
+    _publish(refreshing=True)
+    write_shared_meta(SNAPSHOT_NAME, refreshing=True)
+    try:
+        with timed("gw2_refresh_seconds"):
+            data = _refresher["loader"]()
+        previous = _snapshot["data"]
+        updated_at = datetime.now(timezone.utc)
+        _publish(data=data, updated_at=updated_at)
+        # Other workers only reload the data when it actually changed
+        if data is not previous:
+            write_shared_frame(SNAPSHOT_NAME, data, updated_at=updated_at.isoformat())
+            for listener in _refresh_listeners:
+                try:
+                    listener(previous, data)
+                except Exception as e:
+                    print(f"Error notifying refresh listener: {e}")
+        else:
+            write_shared_meta(SNAPSHOT_NAME, updated_at=updated_at.isoformat())
+    finally:
+        _publish(refreshing=False)
+        write_shared_meta(SNAPSHOT_NAME, refreshing=False)
+
+
+# Function to mirror the snapshot another worker process published
+def follow_snapshot():
+    meta = read_shared_meta(SNAPSHOT_NAME)
+    followed = _refresher["followed"] or {}
+    if meta is None or meta == followed:
+        return
+    fields = {"refreshing": meta.get("refreshing", False)}
+    if meta.get("updated_at"):
+        fields["updated_at"] = datetime.fromisoformat(meta["updated_at"])
+    if meta.get("frame") is not None and meta["frame"] != followed.get("frame"):
+        fields["data"] = read_shared_frame(SNAPSHOT_NAME, meta)
+    _refresher["followed"] = meta
+    _publish(**fields)
+
+
+# Function to sleep until the next refresh is due or has been requested
+def _wait_for_refresh(interval, started):
+    deadline = time.time() + interval
+    # Requests from any worker, even during the last refresh, cut the wait short
+    while not _wake.wait(SHARED_POLL_INTERVAL):
+        if time.time() >= deadline or shared_refresh_requested(SNAPSHOT_NAME, started):
+            break
+    _wake.clear()
+
+
+# Function run by the background thread, one process is elected to refresh on
+# an interval while the others follow the snapshot it publishes
+def _refresh_loop(interval):
+    while True:
+        if acquire_leadership(SNAPSHOT_NAME):
+            started = time.time()
+            try:
+                refresh_snapshot()
+            except Exception as e:
+                print(f"Error refreshing price snapshot: {e}")
+            _wait_for_refresh(interval, started)
+        else:
+            try:
+                follow_snapshot()
+            except Exception as e:
+                print(f"Error reading shared price snapshot: {e}")
+            _wake.wait(SHARED_POLL_INTERVAL)
+            _wake.clear()
+
+
+# Function to start the background refresher once per process
+def start_snapshot_refresher(loader, interval=REFRESH_INTERVAL):
+    with _lock:
+        if _refresher["thread"] is not None:
+            return
+        _refresher["loader"] = loader
+        _refresher["thread"] = threading.Thread(
+            target=_refresh_loop,
+            args=(interval,),
+            name="snapshot-refresher",
+            daemon=True,
+        )
+        _refresher["thread"].start()
+
+
+# Function to ask the refreshing process for an immediate refresh
+def request_refresh():
+    # Requests made while a refresh is in flight collapse into one follow-up run
+    request_shared_refresh(SNAPSHOT_NAME)
+    _wake.set()
+
+
+# Function to get the current snapshot version, cheap enough to poll
+def get_snapshot_version():
+    return _snapshot["version"]
+
+
+# Function to get the version of the snapshot data, unchanged by idle refreshes
+def get_snapshot_data_version():
+    return _snapshot["data_version"]
+
+
+# Function to get the current snapshot data and its update time
+def get_snapshot():
+    with _lock:
+        return dict(_snapshot)
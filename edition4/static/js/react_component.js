@@ -1,6 +1,64 @@
 console.log("React component script loaded");
 
-const Planet = ReactPlanet.Planet;
+// Easing that overshoots its end, for menus that bounce when opening or closing
+const BOUNCE = 'cubic-bezier(0.34, 1.56, 0.64, 1)';
+
+// Radial menu in the style of react-planet: clicking the center content moves
+// the children out onto an orbit around it, and back in when clicked again
+function Planet({
+  centerContent,
+  children,
+  orbitRadius,
+  rotation,
+  centerRadius,
+  autoClose,
+  bounceOnOpen,
+  bounceOnClose,
+}) {
+  const [open, setOpen] = React.useState(false);
+  const satellites = React.Children.toArray(children);
+  const size = centerRadius * 2;
+
+  // With autoClose, any click after opening (on a satellite or elsewhere) closes it
+  React.useEffect(() => {
+    if (!open || !autoClose) {
+      return undefined;
+    }
+    const close = () => setOpen(false);
+    document.addEventListener('click', close);
+    return () => document.removeEventListener('click', close);
+  }, [open, autoClose]);
+
+  return (
+    <div style={{ position: 'relative', display: 'inline-block', width: size, height: size }}>
+      {satellites.map((satellite, index) => {
+        const angle = (((360 / satellites.length) * index + rotation) * Math.PI) / 180;
+        const x = open ? orbitRadius * Math.cos(angle) : 0;
+        const y = open ? orbitRadius * Math.sin(angle) : 0;
+        const bounce = open ? bounceOnOpen : bounceOnClose;
+        return (
+          <div
+            key={index}
+            style={{
+              position: 'absolute',
+              left: '50%',
+              top: '50%',
+              opacity: open ? 1 : 0,
+              pointerEvents: open ? 'auto' : 'none',
+              transform: `translate(-50%, -50%) translate(${x}px, ${y}px)`,
+              transition: `transform 0.4s ${bounce ? BOUNCE : 'ease-out'}, opacity 0.2s`,
+            }}
+          >
+            {satellite}
+          </div>
+        );
+      })}
+      <div onClick={() => setOpen(!open)} style={{ position: 'relative' }}>
+        {centerContent}
+      </div>
+    </div>
+  );
+}
 
 function PlanetMenu() {
   console.log("Rendering PlanetMenu");